@@ -1,9 +1,64 @@
-from .help import help_tree
-from .api_factory import create_api
+# NOTE: typing is not imported at runtime because it is the heaviest part of `import dirapi`.  # noqa
+# Type checkers treat a variable named (_)TYPE_CHECKING as True.
+_TYPE_CHECKING = False
+if _TYPE_CHECKING:
+    from typing import Any, Dict, List
+    from .backends import (
+        DictBackend,
+        FsspecBackend,
+        LocalBackend,
+        TarBackend,
+        ZipBackend,
+    )
+    from .help import help_tree
+    from .api_factory import create_api
+    from .cache import ContentCache
+    from .concurrency import SingleFlight
+    from .manifest import Manifest
+    from .meta import CollisionPolicy
 
 __version__ = "0.0.0"
 
 __all__ = [
-    create_api.__name__,
-    help_tree.__name__,
+    "create_api",
+    "ContentCache",
+    "SingleFlight",
+    "CollisionPolicy",
+    "Manifest",
+    "DictBackend",
+    "FsspecBackend",
+    "LocalBackend",
+    "TarBackend",
+    "ZipBackend",
+    "help_tree",
 ]
+
+# NOTE: the attributes are imported lazily to make `import dirapi` fast.
+# For example, dirapi.help imports inspect which is heavy.
+_LAZY_ATTRS: "Dict[str, str]" = {
+    "create_api": "api_factory",
+    "ContentCache": "cache",
+    "SingleFlight": "concurrency",
+    "CollisionPolicy": "meta",
+    "Manifest": "manifest",
+    "DictBackend": "backends",
+    "FsspecBackend": "backends",
+    "LocalBackend": "backends",
+    "TarBackend": "backends",
+    "ZipBackend": "backends",
+    "help_tree": "help",
+}
+
+
+def __getattr__(name: str) -> "Any":
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # NOTE: __import__ with level=1 is `from .module import name`, which does not need importlib.  # noqa
+    attr = getattr(__import__(_LAZY_ATTRS[name], globals(), None, [name], 1), name)  # noqa
+    # cache the attribute so that __getattr__ is not called again
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> "List[str]":
+    return sorted(set(globals()) | set(__all__))
@@ -1,14 +1,30 @@
-from mypy_extensions import VarArg, KwArg
-from typing import Any, Callable, Dict, Optional
+from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Optional, Union  # noqa
 
-from .meta import Directory
+from .meta import CollisionPolicy, Directory
+
+# NOTE: the following modules are used only for type annotations.
+if TYPE_CHECKING:
+    from mypy_extensions import VarArg, KwArg
+    from .backends import Backend
+    from .cache import ContentCache
+    from .concurrency import SingleFlight
 
 
 def create_api(
     root_dir: str,
     func_map: Optional[Dict[str, Callable[[str, VarArg(), KwArg()], Any]]] = None,  # noqa
     ext_2_func_map: Optional[Dict[str, Dict[str, Callable[[str, VarArg(), KwArg()], Any]]]] = None,  # noqa
+    cache: Optional[ContentCache] = None,
+    single_flight: Optional[SingleFlight] = None,
+    backend: Optional[Backend] = None,
+    include: Optional[Collection[str]] = None,
+    exclude: Collection[str] = (),
+    max_depth: Optional[int] = None,
+    follow_symlinks: bool = False,
+    skip_hidden: bool = True,
+    collision: Union[str, CollisionPolicy] = "suffix",
 ):
     """Create api associated with directories' structure
 
@@ -48,6 +64,39 @@ def create_api(
             The first argument is the path to a file in the directory structure.
         ext_2_func_map (Optional[Dict[str, Dict[str, Callable[[str, VarArg, optional):
             (File extension, Dictionary of attribute names and methods)-dictionary. Defaults to None.
+        cache (Optional[ContentCache], optional):
+            Cache to share results of the methods among byte-identical files. Defaults to None.
+            Only the methods in cache.methods are cached and the others are called directly.
+            If None, the results are not cached.
+        single_flight (Optional[SingleFlight], optional):
+            Coalescer to execute concurrent calls of the methods for the same file and arguments only once,
+            optionally with per-file readers-writer locks. Defaults to None.
+            If None, the calls are not coalesced.
+        backend (Optional[Backend], optional):
+            Backend to list directories and open files. Defaults to None.
+            If None, LocalBackend is used and the methods receive paths as str.
+            Otherwise, for example ZipBackend, TarBackend or DictBackend,
+            root_dir is a path in the backend like "" for the root of an archive
+            and the methods receive BackendPath which has open(), read_bytes() and read_text().
+        include (Optional[Collection[str]], optional):
+            Glob patterns of files to be included like "*.json". Defaults to None.
+            The patterns are matched with file names and paths relative to root_dir.
+            If None, all files are included.
+        exclude (Collection[str], optional):
+            Glob patterns of files and directories to be excluded like ".git" or "__pycache__". Defaults to ().
+            Excluded directories are never scanned.
+        max_depth (Optional[int], optional):
+            The maximum depth of directories to be scanned. Defaults to None.
+            For example, if max_depth is 1, only files and directories directly under root_dir are listed.
+            If None, all directories are scanned.
+        follow_symlinks (bool, optional):
+            Whether to descend into symbolic links to directories. Defaults to False.
+        skip_hidden (bool, optional):
+            Whether to skip files and directories whose names start with ".". Defaults to True.
+        collision (Union[str, CollisionPolicy], optional):
+            How to resolve names which collide like "a.json" and "a.csv". Defaults to "suffix".
+            One of "suffix", "extension-qualified", "error" and "group". See CollisionPolicy for details.
+            The report of collisions is available with Api.collisions().
 
     Returns:
         Directory: Api for the directory.
@@ -58,4 +107,20 @@ def create_api(
         ext_2_func_map will not be used but func_map will be used.
 
     """  # noqa
-    return Directory("Api", (), {}, root_dir, func_map, ext_2_func_map)
+    return Directory(
+        "Api",
+        (),
+        {},
+        root_dir,
+        func_map,
+        ext_2_func_map,
+        cache,
+        single_flight=single_flight,
+        backend=backend,
+        include=include,
+        exclude=exclude,
+        max_depth=max_depth,
+        follow_symlinks=follow_symlinks,
+        skip_hidden=skip_hidden,
+        collision=collision,
+    )
@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import io
+import os
+import posixpath
+import threading
+import time
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, NamedTuple, Optional, Union  # noqa
+
+if TYPE_CHECKING:
+    import tarfile
+    import zipfile
+
+
+class StatResult(NamedTuple):
+    """Minimal stat result compatible with os.stat_result"""
+    st_size: int
+    st_mtime: float
+    st_mtime_ns: int
+
+
+class MemberEntry:
+    """Entry in a listing of a backend which is compatible with os.DirEntry"""
+
+    __slots__ = ("name", "_stat")
+
+    def __init__(self, name: str, stat: Optional[StatResult]):
+        """Entry in a listing of a backend
+
+        Args:
+            name (str): the name of a file or a directory.
+            stat (Optional[StatResult]): the stat of a file. None for a directory.
+        """  # noqa
+        self.name: str = name
+        self._stat: Optional[StatResult] = stat
+
+    def is_dir(self) -> bool:
+        return self._stat is None
+
+    def is_file(self) -> bool:
+        return self._stat is not None
+
+    def stat(self) -> StatResult:
+        if self._stat is None:
+            return StatResult(0, 0.0, 0)
+        return self._stat
+
+
+class Backend:
+    """Base class of backends used to list directories and open files
+
+    Subclasses must implement scandir, stat and open.
+    """
+
+    def join(self, path: str, name: str) -> str:
+        """Join a path of a directory and a name in it"""
+        return posixpath.join(path, name)
+
+    def scandir(self, path: str, follow_symlinks: bool = True) -> Iterator[Any]:  # noqa
+        """Iterate files and directories in a directory
+
+        Args:
+            path (str): the path to a directory.
+            follow_symlinks (bool, optional): whether to list symbolic links to directories. Defaults to True.
+
+        Yields:
+            entries which have `name`, `is_dir()` and `stat()` like os.DirEntry.
+        """  # noqa
+        raise NotImplementedError
+
+    def stat(self, path: str) -> Any:
+        """Return the stat of a file which has st_size, st_mtime and st_mtime_ns"""  # noqa
+        raise NotImplementedError
+
+    def open(self, path: str, mode: str = "rb") -> IO[Any]:
+        """Open a file
+
+        Args:
+            path (str): the path to a file.
+            mode (str, optional): "rb" or "r". Defaults to "rb".
+                Text is decoded with utf-8.
+
+        Returns:
+            IO[Any]: file object.
+        """
+        raise NotImplementedError
+
+    def resolve(self, path: str) -> Union[str, BackendPath]:
+        """Return the object which is given to the methods of File classes"""
+        return BackendPath(self, path)
+
+
+class LocalBackend(Backend):
+    """Backend for the local filesystem
+
+    The methods of File classes receive paths as str.
+    """
+
+    def join(self, path: str, name: str) -> str:
+        return os.path.join(path, name)
+
+    def scandir(self, path: str, follow_symlinks: bool = True) -> Iterator[os.DirEntry]:  # noqa
+        with os.scandir(path) as it:
+            for e in it:
+                if e.is_dir():
+                    if follow_symlinks or not e.is_symlink():
+                        yield e
+                elif e.is_file():
+                    yield e
+
+    def stat(self, path: str) -> os.stat_result:
+        return os.stat(path)
+
+    def open(self, path: str, mode: str = "rb") -> IO[Any]:
+        return open(path, mode) if "b" in mode else open(path, mode, encoding="utf-8")  # noqa
+
+    def resolve(self, path: str) -> Union[str, BackendPath]:
+        return path
+
+
+class BackendPath:
+    """Path-like object of a file in a backend
+
+    This is given to the methods of File classes instead of str when the backend is not LocalBackend.
+
+    Example:
+        >>> Data = create_api("", {"load": lambda p: json.load(p.open())}, backend=ZipBackend("data.zip"))
+    """  # noqa
+
+    __slots__ = ("backend", "path")
+
+    def __init__(self, backend: Backend, path: str):
+        self.backend: Backend = backend
+        self.path: str = path
+
+    @property
+    def name(self) -> str:
+        return posixpath.basename(self.path)
+
+    @property
+    def suffix(self) -> str:
+        return posixpath.splitext(self.path)[1]
+
+    def open(self, mode: str = "rb") -> IO[Any]:
+        return self.backend.open(self.path, mode)
+
+    def stat(self) -> Any:
+        return self.backend.stat(self.path)
+
+    def read_bytes(self) -> bytes:
+        with self.open("rb") as f:
+            data: bytes = f.read()
+        return data
+
+    def read_text(self, encoding: str = "utf-8") -> str:
+        return self.read_bytes().decode(encoding)
+
+    def __str__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.backend!r}, {self.path!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, BackendPath)
+            and self.backend is other.backend
+            and self.path == other.path
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.backend), self.path))
+
+
+class _IndexedBackend(Backend):
+    """Backend whose directory structure is indexed once
+
+    Listing a directory and looking up a file are O(1) with the index.
+    """
+
+    def __init__(self):
+        # directory path -> (name -> stat of a file or None for a directory)
+        self._index: Dict[str, Dict[str, Optional[StatResult]]] = {"": {}}
+
+    def _add(self, path: str, stat: Optional[StatResult]) -> None:
+        """Add a file (or a directory if stat is None) and its parent directories to the index"""  # noqa
+        path = _normalize(path)
+        if not path:
+            return
+        parent, name = posixpath.split(path)
+        if stat is None:
+            self._index.setdefault(path, {})
+        siblings = self._index.get(parent)
+        if siblings is None:
+            self._add(parent, None)
+            siblings = self._index[parent]
+        if stat is not None or name not in siblings:
+            siblings[name] = stat
+
+    def _file_stat(self, path: str) -> StatResult:
+        parent, name = posixpath.split(_normalize(path))
+        stat: Optional[StatResult] = self._index.get(parent, {}).get(name)
+        if stat is None:
+            raise FileNotFoundError(path)
+        return stat
+
+    def scandir(self, path: str, follow_symlinks: bool = True) -> Iterator[MemberEntry]:  # noqa
+        try:
+            children = self._index[_normalize(path)]
+        except KeyError:
+            raise FileNotFoundError(path)
+        for name, stat in children.items():
+            yield MemberEntry(name, stat)
+
+    def stat(self, path: str) -> StatResult:
+        return self._file_stat(path)
+
+    def open(self, path: str, mode: str = "rb") -> IO[Any]:
+        f: IO[Any] = io.BytesIO(self._read(_normalize(path)))
+        return f if "b" in mode else io.TextIOWrapper(f, encoding="utf-8")
+
+    def _read(self, path: str) -> bytes:
+        raise NotImplementedError
+
+
+def _normalize(path: str) -> str:
+    """Normalize a path in an archive like "./a//b/" into "a/b". "" for the root."""  # noqa
+    path = posixpath.normpath(path).lstrip("/")
+    return "" if path == "." else path
+
+
+def _stat_result(size: int, mtime: float) -> StatResult:
+    return StatResult(size, mtime, int(mtime * 1e9))
+
+
+class ZipBackend(_IndexedBackend):
+    """Backend for a zip archive
+
+    The central directory of the archive is indexed once when the backend is created.
+    """  # noqa
+
+    def __init__(self, file: Union[str, IO[bytes], zipfile.ZipFile]):
+        """Backend for a zip archive
+
+        Args:
+            file (Union[str, IO[bytes], zipfile.ZipFile]): the path to a zip file, a file object or ZipFile.
+        """  # noqa
+        import zipfile
+        super().__init__()
+        self._zip: zipfile.ZipFile = file if isinstance(file, zipfile.ZipFile) else zipfile.ZipFile(file)  # noqa
+        self._infos: Dict[str, zipfile.ZipInfo] = {}
+        for info in self._zip.infolist():
+            path: str = _normalize(info.filename)
+            if info.is_dir():
+                self._add(path, None)
+            else:
+                self._infos[path] = info
+                mtime: float = time.mktime(info.date_time + (0, 0, -1))
+                self._add(path, _stat_result(info.file_size, mtime))
+
+    def open(self, path: str, mode: str = "rb") -> IO[Any]:
+        # NOTE: ZipFile supports reading members concurrently.
+        f: IO[Any] = self._zip.open(self._infos[_normalize(path)])
+        return f if "b" in mode else io.TextIOWrapper(f, encoding="utf-8")
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+class TarBackend(_IndexedBackend):
+    """Backend for a tar archive
+
+    The members of the archive are indexed once when the backend is created.
+    """
+
+    def __init__(self, file: Union[str, tarfile.TarFile]):
+        """Backend for a tar archive
+
+        Args:
+            file (Union[str, tarfile.TarFile]): the path to a tar file or TarFile.
+        """  # noqa
+        import tarfile
+        super().__init__()
+        self._tar: tarfile.TarFile = file if isinstance(file, tarfile.TarFile) else tarfile.open(file)  # noqa
+        self._members: Dict[str, tarfile.TarInfo] = {}
+        # NOTE: TarFile does not support reading members concurrently.
+        self._lock = threading.Lock()
+        for member in self._tar.getmembers():
+            path: str = _normalize(member.name)
+            if member.isdir():
+                self._add(path, None)
+            elif member.isfile():
+                self._members[path] = member
+                self._add(path, _stat_result(member.size, float(member.mtime)))  # noqa
+
+    def _read(self, path: str) -> bytes:
+        with self._lock:
+            f = self._tar.extractfile(self._members[path])
+            assert f is not None
+            return f.read()
+
+    def close(self) -> None:
+        self._tar.close()
+
+
+DictTree = Dict[str, Union[bytes, str, "DictTree"]]  # type: ignore
+
+
+class DictBackend(_IndexedBackend):
+    """Backend for an in-memory tree
+
+    Example:
+        >>> backend = DictBackend({"data": {"a.json": b"[1, 2]", "b.txt": "text"}})
+        >>> Data = create_api("data", {"load": lambda p: p.read_bytes()}, backend=backend)
+    """  # noqa
+
+    def __init__(self, tree: DictTree, mtime: float = 0.0):  # type: ignore
+        """Backend for an in-memory tree
+
+        Args:
+            tree (DictTree): nested dictionaries whose leaves are bytes or str (encoded with utf-8).
+            mtime (float, optional): modification time of all files. Defaults to 0.0.
+        """  # noqa
+        super().__init__()
+        self._data: Dict[str, bytes] = {}
+
+        def walk(d: DictTree, prefix: str):  # type: ignore
+            for name, v in d.items():
+                path: str = posixpath.join(prefix, name)
+                if isinstance(v, dict):
+                    self._add(path, None)
+                    walk(v, path)
+                else:
+                    data: bytes = v.encode() if isinstance(v, str) else v
+                    self._data[path] = data
+                    self._add(path, _stat_result(len(data), mtime))
+
+        walk(tree, "")
+
+    def _read(self, path: str) -> bytes:
+        try:
+            return self._data[path]
+        except KeyError:
+            raise FileNotFoundError(path)
+
+
+class FsspecBackend(Backend):
+    """Backend for a filesystem of fsspec like s3fs
+
+    Example:
+        >>> import fsspec
+        >>> backend = FsspecBackend(fsspec.filesystem("s3"))
+        >>> Data = create_api("bucket/data", {"load": lambda p: p.read_bytes()}, backend=backend)
+    """  # noqa
+
+    def __init__(self, fs: Any):
+        """Backend for a filesystem of fsspec
+
+        Args:
+            fs (Any): fsspec.AbstractFileSystem.
+        """
+        self.fs: Any = fs
+
+    @staticmethod
+    def _stat(info: Dict[str, Any]) -> StatResult:
+        mtime: Any = info.get("mtime", info.get("LastModified", info.get("last_modified", 0.0)))  # noqa
+        if hasattr(mtime, "timestamp"):
+            mtime = mtime.timestamp()
+        return _stat_result(int(info.get("size") or 0), float(mtime or 0.0))
+
+    def scandir(self, path: str, follow_symlinks: bool = True) -> Iterator[MemberEntry]:  # noqa
+        for info in self.fs.ls(path, detail=True):
+            name: str = posixpath.basename(info["name"].rstrip("/"))
+            if info["type"] == "directory":
+                yield MemberEntry(name, None)
+            elif info["type"] == "file":
+                yield MemberEntry(name, self._stat(info))
+
+    def stat(self, path: str) -> StatResult:
+        return self._stat(self.fs.info(path))
+
+    def open(self, path: str, mode: str = "rb") -> IO[Any]:
+        f: IO[Any] = self.fs.open(path, mode) if "b" in mode else self.fs.open(path, mode, encoding="utf-8")  # noqa
+        return f
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import os
+import threading
+from typing import Any, Callable, Collection, Dict, NamedTuple, Optional, Set, Tuple, Union  # noqa
+
+from .backends import BackendPath
+
+
+# (method, digest, args, sorted kwargs)
+_Key = Tuple[Callable[..., Any], bytes, Tuple[Any, ...], Tuple[Tuple[str, Any], ...]]  # noqa
+
+
+class CacheInfo(NamedTuple):
+    """Counters of ContentCache
+
+    Attributes:
+        hits (int): number of calls whose results are reused.
+        misses (int): number of calls which are actually executed.
+        bytes_saved (int): total size of files which are not loaded thanks to the cache.
+        n_entries (int): number of cached results.
+    """  # noqa
+    hits: int
+    misses: int
+    bytes_saved: int
+    n_entries: int
+
+
+class ContentCache:
+    """Cache of results of methods keyed by the contents of files
+
+    Byte-identical files share one result, which means that the methods are
+    called only once for them and the results are the same objects.
+    So you should not modify the results in place.
+
+    Only the methods listed in methods are cached. They must depend only on the contents of files,
+    so do not list methods which depend on paths or modify files like "save".
+
+    Example:
+        >>> cache = ContentCache(methods={"load"})
+        >>> Data = create_api("./data", {"load": load_json}, cache=cache)
+        >>> Data.Dataset1.load() is Data.Dataset1Copy.load()
+        True
+        >>> cache.info()
+        CacheInfo(hits=1, misses=1, bytes_saved=1024, n_entries=1)
+    """  # noqa
+
+    def __init__(
+        self,
+        methods: Collection[str],
+        maxsize: Optional[int] = 128,
+        chunk_size: int = 1 << 20,
+    ):
+        """Cache of results of methods keyed by the contents of files
+
+        Args:
+            methods (Collection[str]):
+                names of methods in func_map whose results are cached like {"load"}.
+                The other methods are called directly.
+            maxsize (Optional[int], optional):
+                the maximum number of cached results. Defaults to 128.
+                The least recently used results are discarded first. If None, the number is not limited.
+            chunk_size (int, optional):
+                the size of chunks to read files when hashing them. Defaults to 1 << 20.
+        """  # noqa
+        self.methods: Collection[str] = frozenset(methods)
+        self.maxsize: Optional[int] = maxsize
+        self.chunk_size: int = chunk_size
+        # path -> (size, mtime_ns, digest)
+        self._digests: Dict[Union[str, BackendPath], Tuple[int, int, bytes]] = {}  # noqa
+        # digest -> paths whose contents have the digest
+        self._paths: Dict[bytes, Set[Union[str, BackendPath]]] = {}
+        # digest -> keys of the results for the digest
+        self._keys: Dict[bytes, Set[_Key]] = {}
+        self._results: OrderedDict[_Key, Any] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._bytes_saved: int = 0
+        # NOTE: the methods may be called from multiple threads.
+        self._lock = threading.Lock()
+
+    def digest(self, path: Union[str, BackendPath]) -> bytes:
+        """Return the hash of the contents of a file
+
+        The hash is computed lazily and cached with the size and the modification time of the file.
+        It is computed again only when they are changed.
+        Then the results for the old contents are discarded unless another file still has them.
+
+        Args:
+            path (Union[str, BackendPath]): the path to a file.
+
+        Returns:
+            bytes: the hash of the contents.
+        """  # noqa
+        st = path.stat() if isinstance(path, BackendPath) else os.stat(path)
+        cached = self._digests.get(path)
+        if cached is not None and cached[:2] == (st.st_size, st.st_mtime_ns):
+            return cached[2]
+
+        h = hashlib.blake2b(digest_size=16)
+        with (path.open("rb") if isinstance(path, BackendPath) else open(path, "rb")) as f:  # noqa
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                h.update(chunk)
+        digest: bytes = h.digest()
+
+        with self._lock:
+            old = self._digests.get(path)
+            self._digests[path] = (st.st_size, st.st_mtime_ns, digest)
+            self._paths.setdefault(digest, set()).add(path)
+            if old is not None and old[2] != digest:
+                paths = self._paths.get(old[2], set())
+                paths.discard(path)
+                if not paths:
+                    self._paths.pop(old[2], None)
+                    for key in self._keys.pop(old[2], ()):
+                        del self._results[key]
+        return digest
+
+    def call(self, func: Callable[..., Any], path: Union[str, BackendPath], *args, **kwargs) -> Any:  # noqa
+        """Call func(path, *args, **kwargs) or return the cached result for the same contents
+
+        Args:
+            func (Callable[..., Any]): a method in func_map.
+            path (Union[str, BackendPath]): the path to a file.
+
+        Returns:
+            Any: func(path, *args, **kwargs)
+
+        NOTE:
+            When args or kwargs are not hashable, the cache is not used.
+        """  # noqa
+        digest: bytes = self.digest(path)
+        key: _Key = (func, digest, args, tuple(sorted(kwargs.items())))
+        try:
+            with self._lock:
+                result = self._results[key]
+                self._results.move_to_end(key)
+                self._hits += 1
+                self._bytes_saved += self._digests[path][0]
+            return result
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable arguments
+            return func(path, *args, **kwargs)
+
+        result = func(path, *args, **kwargs)
+        with self._lock:
+            self._misses += 1
+            if key in self._results:
+                # NOTE: keep the first result when another thread has loaded the same contents  # noqa
+                return self._results[key]
+            if digest not in self._paths:
+                # NOTE: the contents have been replaced while func was running
+                return result
+            self._results[key] = result
+            self._keys.setdefault(digest, set()).add(key)
+            if self.maxsize is not None and len(self._results) > self.maxsize:
+                old_key, _ = self._results.popitem(last=False)
+                keys = self._keys[old_key[1]]
+                keys.discard(old_key)
+                if not keys:
+                    del self._keys[old_key[1]]
+        return result
+
+    def info(self) -> CacheInfo:
+        """Return the counters of this cache"""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._bytes_saved,
+                len(self._results),
+            )
+
+    def clear(self) -> None:
+        """Clear the cached hashes, results and counters"""
+        with self._lock:
+            self._digests.clear()
+            self._paths.clear()
+            self._keys.clear()
+            self._results.clear()
+            self._hits = 0
+            self._misses = 0
+            self._bytes_saved = 0
@@ -0,0 +1,201 @@
+from contextlib import contextmanager
+import threading
+from typing import Any, Callable, Collection, Dict, Hashable, Iterator, NamedTuple, Optional  # noqa
+
+
+class RWLock:
+    """Readers-writer lock
+
+    Many readers can hold the lock at the same time, while a writer holds it exclusively.
+    Waiting writers are given priority over new readers to avoid starvation.
+
+    The lock is reentrant per thread: a thread which holds it as a reader or a writer
+    can hold it again as a reader without waiting, and a writer can hold it again as a writer.
+    So a method can call another method of the same file.
+    However, a reader cannot be upgraded to a writer and RuntimeError is raised instead of a deadlock.
+    """  # noqa
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        # thread id -> number of times the thread holds the lock as a reader
+        self._readers: Dict[int, int] = {}
+        self._writer: Optional[int] = None
+        self._writer_depth: int = 0
+        self._waiting_writers: int = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock as a reader"""
+        me: int = threading.get_ident()
+        with self._cond:
+            if me not in self._readers and self._writer != me:
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+            self._readers[me] = self._readers.get(me, 0) + 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                if self._readers[me] > 1:
+                    self._readers[me] -= 1
+                else:
+                    del self._readers[me]
+                    if not self._readers:
+                        self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock as a writer
+
+        Raises:
+            RuntimeError: this thread holds the lock as a reader.
+        """
+        me: int = threading.get_ident()
+        with self._cond:
+            if self._writer != me:
+                if me in self._readers:
+                    raise RuntimeError("A reader cannot be upgraded to a writer.")  # noqa
+                self._waiting_writers += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._cond.wait()
+                finally:
+                    self._waiting_writers -= 1
+                self._writer = me
+            self._writer_depth += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer_depth -= 1
+                if not self._writer_depth:
+                    self._writer = None
+                    self._cond.notify_all()
+
+
+class SingleFlightInfo(NamedTuple):
+    """Counters of SingleFlight
+
+    Attributes:
+        calls (int): number of calls which are actually executed.
+        coalesced (int): number of calls which wait for and share the result of another call.
+    """  # noqa
+    calls: int
+    coalesced: int
+
+
+class _Flight:
+    """Call in flight"""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event: threading.Event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls of methods for the same file and arguments
+
+    While a method is running for a file, the other threads which call it with the same arguments
+    wait for it and receive the same result instead of loading the file again.
+    Unlike ContentCache, the result is not kept after the call finishes.
+
+    Example:
+        >>> single_flight = SingleFlight(lock_files=True, write_methods={"save"})
+        >>> Data = create_api("./data", {"load": load, "save": save}, single_flight=single_flight)
+    """  # noqa
+
+    def __init__(
+        self,
+        lock_files: bool = False,
+        write_methods: Collection[str] = (),
+    ):
+        """Coalesce concurrent calls of methods for the same file and arguments
+
+        Args:
+            lock_files (bool, optional):
+                whether to lock files with readers-writer locks. Defaults to False.
+                If True, methods in write_methods hold the lock of the file exclusively
+                and the other methods hold it shared.
+            write_methods (Collection[str], optional):
+                names of methods which modify files. Defaults to ().
+                They are never coalesced nor cached by ContentCache.
+        """  # noqa
+        self.lock_files: bool = lock_files
+        self.write_methods: Collection[str] = frozenset(write_methods)
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._file_locks: Dict[Any, RWLock] = {}
+        self._calls: int = 0
+        self._coalesced: int = 0
+
+    def file_lock(self, path: Any) -> RWLock:
+        """Return the readers-writer lock of a file"""
+        with self._lock:
+            lock: Optional[RWLock] = self._file_locks.get(path)
+            if lock is None:
+                lock = self._file_locks[path] = RWLock()
+            return lock
+
+    def call(self, name: str, func: Callable[..., Any], path: Any, *args, **kwargs) -> Any:  # noqa
+        """Call func(path, *args, **kwargs) or wait for the same call in flight
+
+        Args:
+            name (str): the name of the method.
+            func (Callable[..., Any]): a method in func_map.
+            path (Any): the path to a file.
+
+        Returns:
+            Any: func(path, *args, **kwargs)
+
+        NOTE:
+            When args or kwargs are not hashable, the calls are not coalesced.
+        """  # noqa
+        if name in self.write_methods:
+            return self._execute(True, func, path, args, kwargs)
+
+        key = (func, path, args, tuple(sorted(kwargs.items())))
+        try:
+            with self._lock:
+                flight: Optional[_Flight] = self._flights.get(key)
+                leader: bool = flight is None
+                if flight is None:
+                    flight = self._flights[key] = _Flight()
+                else:
+                    self._coalesced += 1
+        except TypeError:
+            # unhashable arguments
+            return self._execute(False, func, path, args, kwargs)
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self._execute(False, func, path, args, kwargs)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.event.set()
+        return flight.result
+
+    def _execute(self, write: bool, func: Callable[..., Any], path: Any, args: Any, kwargs: Any) -> Any:  # noqa
+        with self._lock:
+            self._calls += 1
+        if not self.lock_files:
+            return func(path, *args, **kwargs)
+        lock: RWLock = self.file_lock(path)
+        with (lock.write() if write else lock.read()):
+            return func(path, *args, **kwargs)
+
+    def info(self) -> SingleFlightInfo:
+        """Return the counters"""
+        with self._lock:
+            return SingleFlightInfo(self._calls, self._coalesced)
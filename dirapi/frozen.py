@@ -0,0 +1,117 @@
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, Mapping
+
+from .meta import Directory, _Node
+
+
+class FrozenNode:
+    """Read-only snapshot of a class created by create_api
+
+    The nested nodes and the methods are resolved in advance and stored in the instance dictionary,
+    so an attribute access is a plain dictionary lookup.
+    """  # noqa
+
+    def __init__(self, cls: _Node, table: Dict[str, Callable[..., Any]]):
+        """Read-only snapshot of a class created by create_api
+
+        Args:
+            cls (_Node): a Directory or File class.
+            table (Dict[str, Callable[..., Any]]):
+                (qualified name, method)-dictionary which the methods of this node and the nested nodes are added to.
+        """  # noqa
+        set_ = object.__setattr__
+        set_(self, "__name__", cls.__name__)
+        set_(self, "__qualname__", cls.__qualname__)
+        set_(self, "__dirapi_path__", _Node.path(cls))
+        for k, v in vars(cls).items():
+            # NOTE: choose by the values because nested classes may be named like "__Init__" for "__init__.py"  # noqa
+            if k.startswith("__dirapi_"):
+                continue
+            if isinstance(v, _Node):
+                v = FrozenNode(v, table)
+            elif isinstance(v, partial):
+                # methods in func_map
+                table[f"{cls.__qualname__}.{k}"] = v
+            elif k.startswith("__") and k.endswith("__"):
+                # attributes of classes like __module__ and __dict__
+                continue
+            elif callable(v):
+                table[f"{cls.__qualname__}.{k}"] = v
+            set_(self, k, v)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.__dict__['__qualname__']}>"
+
+
+class FrozenApi(FrozenNode):
+    """Read-only snapshot of an api with a flat dispatch table
+
+    Example:
+        >>> Frozen = Data.freeze()
+        >>> Frozen.Datasource1.Dataset1.load()
+        >>> Frozen["Api.Datasource1.Dataset1.load"]()
+        >>> # the fastest way in tight loops
+        >>> table = dispatch_table(Frozen)
+        >>> table["Api.Datasource1.Dataset1.load"]()
+
+    NOTE:
+        Only the attribute lookups are saved.
+        The methods are the same partial objects as the ones of the classes,
+        so the cost of calling them is not reduced.
+    """
+
+    def __init__(self, cls: Directory):
+        """Read-only snapshot of an api
+
+        Args:
+            cls (Directory): api created by create_api.
+        """
+        table: Dict[str, Callable[..., Any]] = {}
+        super().__init__(cls, table)
+        object.__setattr__(self, "__dirapi_table__", MappingProxyType(table))
+
+    def __getitem__(self, qualname: str) -> Callable[..., Any]:
+        """Return the method with its qualified name like "Api.Dir.File.load"
+        """
+        return dispatch_table(self)[qualname]
+
+    def __contains__(self, qualname: object) -> bool:
+        return qualname in dispatch_table(self)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dispatch_table(self))
+
+    def __len__(self) -> int:
+        return len(dispatch_table(self))
+
+
+def freeze(api: Directory) -> FrozenApi:
+    """Convert an api into a read-only snapshot
+
+    Args:
+        api (Directory): api created by create_api.
+
+    Returns:
+        FrozenApi: snapshot whose attributes are resolved in advance.
+    """
+    return FrozenApi(api)
+
+
+def dispatch_table(frozen: FrozenApi) -> Mapping[str, Callable[..., Any]]:
+    """Return the read-only (qualified name, method)-dictionary of a snapshot
+
+    Args:
+        frozen (FrozenApi): snapshot created by freeze.
+
+    Returns:
+        Mapping[str, Callable[..., Any]]: dispatch table.
+    """
+    table: Mapping[str, Callable[..., Any]] = frozen.__dict__["__dirapi_table__"]  # noqa
+    return table
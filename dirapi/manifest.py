@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .meta import CollisionPolicy, Directory, Group, _Entry, _Node
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+
+COLUMNS = ("path", "parent", "depth", "is_dir", "size", "mtime", "name")
+
+
+class Manifest:
+    """Columnar manifest of a directory structure
+
+    Each row corresponds to a directory or a file and row 0 is the root directory.
+
+    Attributes:
+        root (str): the path to the root directory.
+        collision (str): the policy which resolved the names like "suffix". See CollisionPolicy.
+        path (List[str]): paths relative to root separated by "/". "" for the root.
+        parent (List[int]): row indices of the parent directories. -1 for the root.
+        depth (List[int]): depths. 0 for the root.
+        is_dir (List[bool]): whether the rows are directories.
+        size (List[int]): file sizes or total sizes of the files in the directories.
+        mtime (List[float]): modification times of files or the newest ones in the directories.
+            0.0 for directories without files.
+        name (List[str]): attribute names in the parent classes like "Dataset1".
+            Files in a group are named like "Dataset.Json".
+
+    Example:
+        >>> manifest = Data.to_manifest()
+        >>> arrays = manifest.to_numpy()
+        >>> arrays["path"][arrays["size"] > 1 << 20]  # large files
+        >>> manifest.save_npz("manifest.npz")
+        >>> Data = Manifest.load_npz("manifest.npz").create_api({"load": load})
+    """  # noqa
+
+    def __init__(self, root: str, collision: str = CollisionPolicy.SUFFIX.value):  # noqa
+        self.root: str = root
+        self.collision: str = CollisionPolicy(collision).value
+        self.path: List[str] = []
+        self.parent: List[int] = []
+        self.depth: List[int] = []
+        self.is_dir: List[bool] = []
+        self.size: List[int] = []
+        self.mtime: List[float] = []
+        self.name: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.path)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(root={self.root!r}, collision={self.collision!r}, rows={len(self)})"  # noqa
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """Return (column name, column)-dictionary"""
+        return {c: getattr(self, c) for c in COLUMNS}
+
+    def append(
+        self,
+        path: str,
+        parent: int,
+        depth: int,
+        is_dir: bool,
+        size: int,
+        mtime: float,
+        name: str,
+    ) -> int:
+        """Append a row and return its index"""
+        self.path.append(path)
+        self.parent.append(parent)
+        self.depth.append(depth)
+        self.is_dir.append(is_dir)
+        self.size.append(size)
+        self.mtime.append(mtime)
+        self.name.append(name)
+        return len(self.path) - 1
+
+    @classmethod
+    def from_api(cls, api: Directory) -> "Manifest":
+        """Create a manifest from an api created by create_api
+
+        Args:
+            api (Directory): api.
+
+        Returns:
+            Manifest: manifest of the directory structure.
+        """
+        policy: CollisionPolicy = api.__dict__.get("__dirapi_collision__", CollisionPolicy.SUFFIX)  # noqa
+        manifest = cls(_Node.path(api), policy.value)
+        stats = _Node.stats(api)
+        manifest.append("", -1, 0, True, stats.size, stats.mtime or 0.0, api.__qualname__)  # noqa
+
+        def walk(d: Directory, index: int, relpath: str, depth: int, prefix: str):  # noqa
+            for attr, child in d.named_children():
+                if isinstance(child, Group):
+                    walk(child, index, relpath, depth, f"{prefix}{attr}.")
+                    continue
+                stats = _Node.stats(child)
+                name: str = os.path.basename(_Node.path(child))
+                path: str = f"{relpath}/{name}" if relpath else name
+                i: int = manifest.append(
+                    path,
+                    index,
+                    depth + 1,
+                    isinstance(child, Directory),
+                    stats.size,
+                    stats.mtime or 0.0,
+                    f"{prefix}{attr}",
+                )
+                if isinstance(child, Directory):
+                    walk(child, i, path, depth + 1, "")
+
+        walk(api, 0, "", 0, "")
+        return manifest
+
+    def listing(self) -> Dict[str, List[_Entry]]:
+        """Return (relative path of a directory, entries)-dictionary"""
+        listing: Dict[str, List[_Entry]] = {}
+        for i in range(1, len(self)):
+            entries = listing.setdefault(self.path[self.parent[i]], [])
+            entries.append(_Entry(
+                os.path.basename(self.path[i]),
+                self.is_dir[i],
+                0 if self.is_dir[i] else self.size[i],
+                0.0 if self.is_dir[i] else self.mtime[i],
+            ))
+        for entries in listing.values():
+            entries.sort(key=lambda e: e.name)
+        return listing
+
+    def create_api(self, *args: Any, root_dir: Optional[str] = None, **kwargs: Any) -> Directory:  # noqa
+        """Reconstruct an api from this manifest without scanning directories
+
+        Args:
+            args: positional arguments for create_api after root_dir like func_map.
+            root_dir (Optional[str], optional):
+                the path to the root directory. Defaults to None.
+                If None, self.root is used.
+            kwargs: keyword arguments for create_api like func_map.
+                Arguments for filtering like include are ignored
+                because the entries in the manifest are already filtered.
+                collision defaults to self.collision, so the same names as the exported api are restored.
+
+        Returns:
+            Directory: Api for the directory.
+        """  # noqa
+        return Directory(
+            "Api",
+            (),
+            {},
+            self.root if root_dir is None else root_dir,
+            *args,
+            _listing=self.listing(),
+            **{"collision": self.collision, **kwargs},
+        )
+
+    def to_numpy(self) -> Dict[str, np.ndarray]:
+        """Convert columns into NumPy arrays
+
+        Returns:
+            Dict[str, np.ndarray]: (column name, array)-dictionary.
+
+        Raises:
+            ImportError: numpy is not installed.
+        """
+        import numpy as np
+        return {
+            "path": np.array(self.path, dtype=str),
+            "parent": np.array(self.parent, dtype=np.int64),
+            "depth": np.array(self.depth, dtype=np.int32),
+            "is_dir": np.array(self.is_dir, dtype=bool),
+            "size": np.array(self.size, dtype=np.int64),
+            "mtime": np.array(self.mtime, dtype=np.float64),
+            "name": np.array(self.name, dtype=str),
+        }
+
+    @classmethod
+    def from_columns(
+        cls,
+        root: str,
+        columns: Dict[str, Any],
+        collision: str = CollisionPolicy.SUFFIX.value,
+    ) -> "Manifest":
+        """Create a manifest from columns like the result of to_numpy
+
+        Args:
+            root (str): the path to the root directory.
+            columns (Dict[str, Any]): (column name, sequence)-dictionary.
+            collision (str, optional): the policy which resolved the names. Defaults to "suffix".
+
+        Returns:
+            Manifest: manifest.
+        """  # noqa
+        manifest = cls(root, collision)
+        manifest.path = [str(v) for v in columns["path"]]
+        manifest.parent = [int(v) for v in columns["parent"]]
+        manifest.depth = [int(v) for v in columns["depth"]]
+        manifest.is_dir = [bool(v) for v in columns["is_dir"]]
+        manifest.size = [int(v) for v in columns["size"]]
+        manifest.mtime = [float(v) for v in columns["mtime"]]
+        manifest.name = [str(v) for v in columns["name"]]
+        return manifest
+
+    def save_npz(self, file: str) -> None:
+        """Save this manifest as a .npz file. numpy is required."""
+        import numpy as np
+        np.savez(
+            file,
+            root=np.array(self.root, dtype=str),
+            collision=np.array(self.collision, dtype=str),
+            **self.to_numpy(),  # type: ignore
+        )
+
+    @classmethod
+    def load_npz(cls, file: str) -> "Manifest":
+        """Load a manifest from a .npz file. numpy is required."""
+        import numpy as np
+        with np.load(file, allow_pickle=False) as data:
+            collision: str = str(data["collision"]) if "collision" in data.files else CollisionPolicy.SUFFIX.value  # noqa
+            return cls.from_columns(str(data["root"]), data, collision)
+
+    def to_arrow(self) -> pa.Table:
+        """Convert this manifest into a pyarrow.Table. pyarrow is required."""
+        import pyarrow as pa
+        return pa.table(
+            self.columns(),
+            metadata={"root": self.root, "collision": self.collision},
+        )
+
+    def save_parquet(self, file: str) -> None:
+        """Save this manifest as a parquet file. pyarrow is required."""
+        import pyarrow.parquet as pq
+        pq.write_table(self.to_arrow(), file)
+
+    @classmethod
+    def load_parquet(cls, file: str) -> "Manifest":
+        """Load a manifest from a parquet file. pyarrow is required."""
+        import pyarrow.parquet as pq
+        table = pq.read_table(file)
+        metadata: Dict[bytes, bytes] = table.schema.metadata
+        root: str = metadata[b"root"].decode()
+        collision: str = metadata.get(b"collision", CollisionPolicy.SUFFIX.value.encode()).decode()  # noqa
+        return cls.from_columns(root, table.to_pydict(), collision)
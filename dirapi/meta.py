@@ -1,11 +1,25 @@
+from __future__ import annotations
+
+from enum import Enum
+import fnmatch
 from functools import partial, wraps
 import itertools
 from logging import Logger, getLogger
-from mypy_extensions import VarArg, KwArg
 import os
 import re
-from typing import Any, Callable, Dict, List, Optional, Tuple
-
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Iterator, List, NamedTuple, Optional, Pattern, Set, Tuple, Union  # noqa
+
+# NOTE: the following modules are used only for type annotations.
+if TYPE_CHECKING:
+    from mypy_extensions import VarArg, KwArg
+    from .cache import ContentCache
+    from .concurrency import SingleFlight
+    from .frozen import FrozenApi
+    from .manifest import Manifest
+
+from .backends import Backend, LocalBackend
+from .prefetch import prefetch_map, warm_up
+from .stats import Stats, file_stats, merge_stats
 from .utils import snake2camel
 
 
@@ -14,8 +28,366 @@ DELETE_PATTERNS: str = r"(\(|\)|\{|\}|\[|\]|\\|\?|\*|\$|\^)"
 
 _logger: Logger = getLogger(__name__)
 
+_LOCAL_BACKEND: Backend = LocalBackend()
+
+
+class _Entry(NamedTuple):
+    """Entry in a directory listing"""
+    name: str
+    is_dir: bool
+    size: int
+    mtime: float
+
+
+class _Scan(NamedTuple):
+    """Options to list a directory again when its statistics are invalidated"""  # noqa
+    relpath: str
+    include: Optional[Pattern[str]]
+    exclude: Optional[Pattern[str]]
+    skip_hidden: bool
+    follow_symlinks: bool
+    max_depth: Optional[int]
+
+
+def _compile_patterns(patterns: Optional[Collection[str]]) -> Optional[Pattern[str]]:  # noqa
+    """Compile glob patterns into a regular expression
+
+    Args:
+        patterns (Optional[Collection[str]]): glob patterns like "*.json".
+
+    Returns:
+        Optional[Pattern[str]]: regular expression which matches strings matched by any of patterns.
+            None if patterns is None.
+    """  # noqa
+    if patterns is None:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns) or r"(?!)")  # noqa
+
+
+def _scandir(
+    backend: Backend,
+    root: str,
+    relpath: str = "",
+    include: Optional[Pattern[str]] = None,
+    exclude: Optional[Pattern[str]] = None,
+    skip_hidden: bool = False,
+    follow_symlinks: bool = True,
+) -> List[_Entry]:
+    """List entries in a directory sorted by their names
+
+    Args:
+        backend (Backend): backend to list the directory.
+        root (str): the path to a directory.
+        relpath (str, optional): the path to root relative to the root of the api. Defaults to "".
+        include (Optional[Pattern[str]], optional):
+            pattern of files to be listed. Defaults to None.
+            If None, all files are listed.
+        exclude (Optional[Pattern[str]], optional):
+            pattern of files and directories not to be listed. Defaults to None.
+        skip_hidden (bool, optional): whether to skip entries whose names start with ".". Defaults to False.
+        follow_symlinks (bool, optional): whether to list symbolic links to directories. Defaults to True.
+
+    Returns:
+        List[_Entry]: files and directories in root.
+            Entries which are neither files nor directories are ignored.
+
+    NOTE:
+        include and exclude are matched with both the name of an entry and the path relative to the root of the api.
+        The entries are filtered before getting their statistics.
+    """  # noqa
+    entries: List[_Entry] = []
+    for e in backend.scandir(root, follow_symlinks):
+        name: str = e.name
+        if skip_hidden and name.startswith("."):
+            continue
+        rel: str = f"{relpath}/{name}" if relpath else name
+        if exclude is not None and (exclude.match(name) or exclude.match(rel)):  # noqa
+            continue
+        if e.is_dir():
+            entries.append(_Entry(name, True, 0, 0.0))
+        else:
+            if include is not None and not (include.match(name) or include.match(rel)):  # noqa
+                continue
+            st = e.stat()
+            entries.append(_Entry(name, False, st.st_size, st.st_mtime))
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+class CollisionPolicy(Enum):
+    """Policy to resolve names of nested classes which collide
+
+    For example, "a.json" and "a.csv" are both transformed to "A".
+    The colliding entries are ordered with files first and then directories, each in order of their names.
+    For example, "a.json" comes before the directory "a".
+
+    SUFFIX:
+        the first entry is named "A" and the others are named "A_2", "A_3", ... in the order above.
+    EXTENSION_QUALIFIED:
+        the entries are named with their extensions like "A_json" and "A_csv".
+        Entries without extensions keep "A".
+    ERROR:
+        ValueError is raised.
+    GROUP:
+        the entries are grouped into a class "A" and named with their extensions like "A.Json" and "A.Csv".
+        Directories, files without extensions and files whose extensions collide
+        are named "A._1", "A._2", ... in the order above.
+        The group is a Group class whose path() is the path of the parent directory.
+    """  # noqa
+    SUFFIX = "suffix"
+    EXTENSION_QUALIFIED = "extension-qualified"
+    ERROR = "error"
+    GROUP = "group"
+
+
+class Collision(NamedTuple):
+    """Report of names which collide
 
-class Directory(type):
+    Attributes:
+        directory (str): the path to the directory.
+        name (str): the name which the entries are transformed to.
+        entries (Tuple[str, ...]): the names of the entries in the directory.
+        resolved (Tuple[str, ...]): the resolved names of the entries.
+    """
+    directory: str
+    name: str
+    entries: Tuple[str, ...]
+    resolved: Tuple[str, ...]
+
+
+def _to_camel(name: str) -> str:
+    """Transform a file name or a directory name into a class name
+
+    Args:
+        name (str): file name or directory name.
+
+    Returns:
+        str: class name.
+    """
+    camel_name: str = snake2camel(os.path.splitext(name)[0])
+    camel_name = re.sub(TO_UNDERSCORE_PATTERNS, "_", camel_name)
+    camel_name = re.sub(DELETE_PATTERNS, "", camel_name)
+    return camel_name
+
+
+def _ext_token(name: str) -> str:
+    """Transform the extension of a file name into a part of a class name"""
+    ext: str = os.path.splitext(name)[1][1:]
+    ext = re.sub(TO_UNDERSCORE_PATTERNS, "_", ext)
+    return re.sub(DELETE_PATTERNS, "", ext)
+
+
+def _resolve_names(
+    root: str,
+    entry_names: List[str],
+    policy: CollisionPolicy,
+    reserved: Collection[str] = (),
+) -> Tuple[List[Tuple[str, ...]], List[Collision]]:
+    """Resolve the class names of entries in a directory
+
+    Args:
+        root (str): the path to the directory.
+        entry_names (List[str]): the names of the entries.
+        policy (CollisionPolicy): policy to resolve names which collide.
+        reserved (Collection[str], optional): names which must not be used for renamed entries. Defaults to ().
+
+    Raises:
+        ValueError: names collide and policy is CollisionPolicy.ERROR.
+
+    Returns:
+        Tuple[List[Tuple[str, ...]], List[Collision]]:
+            the resolved names of the entries and the report of collisions.
+            Each resolved name is (class name, ) or (group name, class name in the group).
+    """  # noqa
+
+    # group entries by their class names
+    indices: Dict[str, List[int]] = {}
+    for i, entry_name in enumerate(entry_names):
+        indices.setdefault(_to_camel(entry_name), []).append(i)
+
+    resolved: List[Tuple[str, ...]] = [()] * len(entry_names)
+    collisions: List[Collision] = []
+    taken: Set[str] = set(reserved) | indices.keys()
+
+    def new_name(base: str, used: Set[str], start: int) -> str:
+        k: int = start
+        while f"{base}_{k}" in used:
+            k += 1
+        used.add(f"{base}_{k}")
+        return f"{base}_{k}"
+
+    for camel_name, idx in indices.items():
+
+        if len(idx) == 1:
+            resolved[idx[0]] = (camel_name, )
+            continue
+
+        if policy == CollisionPolicy.ERROR:
+            raise ValueError(f"Names of {[entry_names[i] for i in idx]} in {root} collide as {camel_name}.")  # noqa
+        elif policy == CollisionPolicy.SUFFIX:
+            resolved[idx[0]] = (camel_name, )
+            for i in idx[1:]:
+                resolved[i] = (new_name(camel_name, taken, 2), )
+        elif policy == CollisionPolicy.EXTENSION_QUALIFIED:
+            bare_used: bool = False
+            for i in idx:
+                ext: str = _ext_token(entry_names[i])
+                if not ext and not bare_used:
+                    bare_used = True
+                    resolved[i] = (camel_name, )
+                elif ext and f"{camel_name}_{ext}" not in taken:
+                    taken.add(f"{camel_name}_{ext}")
+                    resolved[i] = (f"{camel_name}_{ext}", )
+                else:
+                    resolved[i] = (new_name(f"{camel_name}_{ext}" if ext else camel_name, taken, 2), )  # noqa
+        elif policy == CollisionPolicy.GROUP:
+            members: Set[str] = set()
+            for i in idx:
+                member: str = snake2camel(_ext_token(entry_names[i]))
+                if member and member not in members:
+                    members.add(member)
+                else:
+                    member = new_name("", members, 1)
+                resolved[i] = (camel_name, member)
+
+        collisions.append(Collision(
+            root,
+            camel_name,
+            tuple(entry_names[i] for i in idx),
+            tuple(".".join(resolved[i]) for i in idx),
+        ))
+
+    return resolved, collisions
+
+
+class _Node(type):
+    """Base metaclass for a file and a directory
+
+    NOTE:
+        Methods in func_map may shadow the methods of this metaclass like path or stats.
+        So they are called through the metaclass like _Node.path(cls) inside this package.
+    """  # noqa
+
+    def path(cls) -> str:
+        """Return the path associated with this class"""
+        path: str = cls.__dict__["__dirapi_path__"]
+        return path
+
+    def backend(cls) -> Backend:
+        """Return the backend used to list and open the files"""
+        backend: Backend = cls.__dict__["__dirapi_backend__"]
+        return backend
+
+    def parent(cls) -> Optional["Directory"]:
+        """Return the class of the parent directory. None for the root."""
+        return cls.__dict__.get("__dirapi_parent__")
+
+    def stats(cls) -> Stats:
+        """Return the memoized statistics of this file or directory
+
+        Returns:
+            Stats: total size, number of files, number of files per extension and the newest modification time.
+
+        NOTE:
+            The statistics are computed when the api is created.
+            Call invalidate_stats to recompute them after files are modified, added or deleted.
+            ext_counts is read-only because the memoized statistics are shared.
+        """  # noqa
+        stats: Optional[Stats] = cls.__dict__.get("__dirapi_stats__")
+        if stats is None:
+            stats = type(cls)._compute_stats(cls)
+            setattr(cls, "__dirapi_stats__", stats)
+        return stats
+
+    def invalidate_stats(cls) -> None:
+        """Invalidate the memoized statistics of this subtree and its ancestors
+
+        When stats() is called next time, the directories in this subtree are listed again
+        with the same filters as create_api, so added and deleted files are counted correctly.
+        The ancestors merge the statistics of their children without listing their directories,
+        and the memoized statistics of the other subtrees are reused.
+
+        NOTE:
+            The classes are not changed. For example, a class for a deleted file remains
+            and its statistics are empty, while an added file has no class until the api is created again.
+        """  # noqa
+        type(cls)._clear_stats(cls)
+        node: Optional[_Node] = _Node.parent(cls)
+        while node is not None:
+            setattr(node, "__dirapi_stats__", None)
+            node = _Node.parent(node)
+
+    def _clear_stats(cls) -> None:
+        setattr(cls, "__dirapi_stats__", None)
+
+    def _compute_stats(cls) -> Stats:
+        raise NotImplementedError
+
+
+def _scan_stats(
+    backend: Backend,
+    path: str,
+    scan: _Scan,
+    nodes: Dict[str, _Node],
+) -> Stats:
+    """List a directory again and compute its statistics
+
+    Args:
+        backend (Backend): backend to list the directory.
+        path (str): the path to the directory.
+        scan (_Scan): options to list the directory.
+        nodes (Dict[str, _Node]): (path, class)-dictionary of the existing entries in the directory.
+            The statistics of the files are updated with the listing.
+
+    Returns:
+        Stats: statistics of the directory. Empty if the directory has been deleted.
+    """  # noqa
+    depth: int = scan.relpath.count("/") + 1 if scan.relpath else 0
+    if scan.max_depth is not None and depth >= scan.max_depth:
+        return merge_stats(())
+    try:
+        entries: List[_Entry] = _scandir(
+            backend,
+            path,
+            scan.relpath,
+            scan.include,
+            scan.exclude,
+            scan.skip_hidden,
+            scan.follow_symlinks,
+        )
+    except FileNotFoundError:
+        return merge_stats(())
+
+    stats: List[Stats] = []
+    for entry in entries:
+        child_path: str = backend.join(path, entry.name)
+        node: Optional[_Node] = nodes.get(child_path)
+        if entry.is_dir and isinstance(node, Directory):
+            stats.append(_Node.stats(node))
+        elif entry.is_dir:
+            # a directory added after the api is created
+            relpath: str = f"{scan.relpath}/{entry.name}" if scan.relpath else entry.name  # noqa
+            stats.append(_scan_stats(backend, child_path, scan._replace(relpath=relpath), {}))  # noqa
+        else:
+            s: Stats = file_stats(os.path.splitext(entry.name)[1], entry.size, entry.mtime)  # noqa
+            if isinstance(node, File):
+                setattr(node, "__dirapi_stats__", s)
+            stats.append(s)
+    return merge_stats(stats)
+
+
+def _link(cls: _Node, path: str, backend: Backend) -> None:
+    """Link a class with its path and children, and memoize its statistics"""
+    setattr(cls, "__dirapi_path__", path)
+    setattr(cls, "__dirapi_backend__", backend)
+    setattr(cls, "__dirapi_parent__", None)
+    children: List[_Node] = list(Directory.children(cls))  # type: ignore
+    for child in children:
+        setattr(child, "__dirapi_parent__", cls)
+    setattr(cls, "__dirapi_stats__", merge_stats(_Node.stats(c) for c in children))  # noqa
+
+
+class Directory(_Node):
     """Metaclass for a directory
     """
 
@@ -27,6 +399,18 @@ class Directory(type):
         root: str,
         func_map: Optional[Dict[str, Callable[[str, VarArg(), KwArg()], Any]]] = None,  # noqa
         ext_2_func_map: Optional[Dict[str, Dict[str, Callable[[str, VarArg(), KwArg()], Any]]]] = None,  # noqa
+        cache: Optional[ContentCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        backend: Optional[Backend] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Collection[str] = (),
+        max_depth: Optional[int] = None,
+        follow_symlinks: bool = False,
+        skip_hidden: bool = True,
+        collision: Union[str, CollisionPolicy] = "suffix",
+        _relpath: str = "",
+        _listing: Optional[Dict[str, List[_Entry]]] = None,
+        _patterns: Optional[Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]] = None,  # noqa
     ):
         f"""Metaclass for a directory
 
@@ -45,6 +429,40 @@ class Directory(type):
                 The path associated with an instance of File will be given to the first argument of the methods.
             ext_2_func_map (Optional[Dict[str, Dict[str, Callable[[str, VarArg, optional):
                 (file extension, Dictionary of attribute names and methods)-dictionary. Defaults to None.
+            cache (Optional[ContentCache], optional):
+                Cache shared by the methods to reuse results for byte-identical files. Defaults to None.
+                If None, the results are not cached.
+            single_flight (Optional[SingleFlight], optional):
+                Coalescer shared by the methods to execute concurrent calls for the same file and arguments only once.
+                Defaults to None. If None, the calls are not coalesced.
+            backend (Optional[Backend], optional):
+                Backend to list directories and open files like ZipBackend. Defaults to None.
+                If None, LocalBackend is used.
+            include (Optional[Collection[str]], optional):
+                Glob patterns of files to be included like "*.json". Defaults to None.
+                If None, all files are included.
+                Directories are not filtered by include.
+            exclude (Collection[str], optional):
+                Glob patterns of files and directories to be excluded like "__pycache__". Defaults to ().
+                Excluded directories are never listed.
+            max_depth (Optional[int], optional):
+                The maximum depth of directories to be listed. Defaults to None.
+                root has depth 0. If None, all directories are listed.
+            follow_symlinks (bool, optional):
+                Whether to descend into symbolic links to directories. Defaults to False.
+            skip_hidden (bool, optional):
+                Whether to skip files and directories whose names start with ".". Defaults to True.
+            collision (Union[str, CollisionPolicy], optional):
+                How to resolve names of nested classes which collide. Defaults to "suffix".
+                See CollisionPolicy.
+            _relpath (str, optional):
+                The path to root relative to the root of the api. Used internally.
+            _listing (Optional[Dict[str, List[_Entry]]], optional):
+                (relative path, entries)-dictionary used instead of scanning directories. Defaults to None.
+                Used internally to reconstruct an api from a manifest.
+            _patterns (Optional[Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]], optional):
+                include and exclude compiled by the root class and passed to the nested classes. Defaults to None.
+                Used internally not to compile them for each directory.
 
         NOTE:
             func_map and ext_2_func_map are given priority in this order.
@@ -60,19 +478,37 @@ class Directory(type):
         namespace = dict(**namespace)
         # namespace for this class
         namespace_update = dict(**namespace)
+        policy: CollisionPolicy = CollisionPolicy(collision)
+        backend = _LOCAL_BACKEND if backend is None else backend
+        if _patterns is None:
+            _patterns = (
+                _compile_patterns(include),
+                _compile_patterns(exclude) if exclude else None,
+            )
 
         # get files and dirs under the root directory.
-        dirs: List[str] = [
-            name for name in os.listdir(root)
-            if os.path.isdir(os.path.join(root, name))
-        ]
-        files: List[str] = [
-            name for name in os.listdir(root)
-            if os.path.isfile(os.path.join(root, name))
-        ]
+        # NOTE: LocalBackend uses os.scandir which lists the directory only once and provides the file types without extra system calls.  # noqa
+        depth: int = _relpath.count("/") + 1 if _relpath else 0
+        entries: List[_Entry]
+        if _listing is not None:
+            entries = _listing.get(_relpath, [])
+        elif max_depth is not None and depth >= max_depth:
+            entries = []
+        else:
+            entries = _scandir(
+                backend,
+                root,
+                _relpath,
+                _patterns[0],
+                _patterns[1],
+                skip_hidden,
+                follow_symlinks,
+            )
+        dirs: List[_Entry] = [e for e in entries if e.is_dir]
+        files: List[_Entry] = [e for e in entries if not e.is_dir]
 
         # create files and directories iterator
-        iterator = itertools.chain(
+        iterator = list(itertools.chain(
             zip(
                 files,
                 [File] * len(files),
@@ -83,15 +519,24 @@ class Directory(type):
                 [Directory] * len(dirs),
                 [(None, None)] * len(dirs)
             ),
+        ))
+
+        # resolve the names of nested classes
+        # NOTE: files come first and then directories, each sorted by their names, so the names are resolved deterministically.  # noqa
+        names, collisions = _resolve_names(
+            root,
+            [entry.name for entry, _, _ in iterator],
+            policy,
+            namespace_update.keys(),
         )
+        if collisions:
+            _logger.warning(f"{len(collisions)} name collisions in {root} are resolved with collision={policy.value}.")  # noqa
 
         # add nested class for files to namespace_update
-        for name_, typ, (func_map_, ext_2_func_map_) in iterator:
-
-            # preparation
-            camel_name: str = snake2camel(os.path.splitext(name_)[0])
-            camel_name = re.sub(TO_UNDERSCORE_PATTERNS, "_", camel_name)
-            camel_name = re.sub(DELETE_PATTERNS, "", camel_name)
+        qualname: str = namespace.get('__qualname__', name)
+        groups: Dict[str, Dict[str, Any]] = {}
+        for (entry, typ, (func_map_, ext_2_func_map_)), names_ in zip(iterator, names):  # noqa
+            name_: str = entry.name
 
             # create a namespace if the nested class
             namespace_ = _create_func_map(
@@ -99,35 +544,199 @@ class Directory(type):
                 name_,
                 func_map_,
                 ext_2_func_map_,
+                cache,
+                backend,
+                single_flight,
             )
             # update the namespace of the nested class
             # NOTE: .update will be namespace | kwargs when python >= 3.9
             namespace_.update(**namespace)
-            namespace_["__qualname__"] = f"{namespace.get('__qualname__', name)}.{camel_name}"  # type: ignore # noqa
-
-            # warning
-            if camel_name in namespace_update:
-                _logger.warning(f"There are duplicated names in {root} when names are transformed to snake case.")  # noqa
+            namespace_["__qualname__"] = ".".join((qualname, ) + names_)  # type: ignore # noqa
 
             # update the namespace of this class
-            namespace_update[camel_name] = typ(
+            child = typ(
                 name,
                 bases,
                 namespace_,
-                root=os.path.join(root, name_),
+                root=backend.join(root, name_),
                 func_map=func_map,
                 ext_2_func_map=ext_2_func_map,
+                cache=cache,
+                single_flight=single_flight,
+                backend=backend,
+                include=include,
+                exclude=exclude,
+                max_depth=max_depth,
+                follow_symlinks=follow_symlinks,
+                skip_hidden=skip_hidden,
+                collision=policy,
+                _relpath=f"{_relpath}/{name_}" if _relpath else name_,
+                _listing=_listing,
+                _patterns=_patterns,
             )
+            if typ is File:
+                setattr(child, "__dirapi_path__", backend.join(root, name_))
+                setattr(child, "__dirapi_backend__", backend)
+                setattr(child, "__dirapi_stats__", file_stats(os.path.splitext(name_)[1], entry.size, entry.mtime))  # noqa
+            if len(names_) == 1:
+                namespace_update[names_[0]] = child
+            else:
+                groups.setdefault(names_[0], dict(**namespace))[names_[1]] = child  # noqa
+
+        # add groups of entries whose names collide
+        for camel_name, members in groups.items():
+            members["__qualname__"] = f"{qualname}.{camel_name}"
+            namespace_update[camel_name] = Group(name, bases, members, root=root, backend=backend)  # noqa
+
+        cls = super().__new__(mcs, name, bases, namespace_update)
+
+        # link this class and its children, and memoize the aggregated statistics bottom-up  # noqa
+        _link(cls, root, backend)
+        setattr(cls, "__dirapi_collisions__", collisions)
+        setattr(cls, "__dirapi_collision__", policy)
+        setattr(cls, "__dirapi_scan__", _Scan(_relpath, _patterns[0], _patterns[1], skip_hidden, follow_symlinks, max_depth))  # noqa
 
         _logger.debug(f"Dictionary.__new__ exit: name={name}, bases={bases}, namespace={namespace}")  # noqa
-        return super().__new__(mcs, name, bases, namespace_update)
+        return cls
 
     def __init__(cls, name, bases, namespace, *args, **kwargs):
         _logger.debug(f"Dictionary.__init__ called: name={name}, bases={bases}, namespace={namespace}")  # noqa
         super().__init__(name, bases, namespace)
 
+    def children(cls) -> Iterator[_Node]:
+        """Iterate classes associated with the files and directories in this directory"""  # noqa
+        for _, v in cls.named_children():
+            yield v
+
+    def named_children(cls) -> Iterator[Tuple[str, _Node]]:
+        """Iterate pairs of attribute names and classes associated with the files and directories in this directory"""  # noqa
+        for k, v in list(vars(cls).items()):
+            # NOTE: skip private attributes like __dirapi_parent__
+            if not k.startswith("__dirapi_") and isinstance(v, _Node):
+                yield k, v
+
+    def freeze(cls) -> FrozenApi:
+        """Convert this api into a read-only snapshot with a flat dispatch table
+
+        Returns:
+            FrozenApi: snapshot whose attributes and methods are resolved in advance.
+                Methods are also available with their qualified names like frozen["Api.Dir.File.load"].
+        """  # noqa
+        from .frozen import freeze
+        return freeze(cls)
+
+    def to_manifest(cls) -> Manifest:
+        """Export the structure of this directory to a columnar manifest
 
-class File(type):
+        Returns:
+            Manifest: columns of paths, parent indices, depths, types, sizes, modification times and names.
+                The api can be reconstructed from the manifest without scanning directories.
+        """  # noqa
+        from .manifest import Manifest
+        return Manifest.from_api(cls)
+
+    def iter_files(
+        cls,
+        prefetch: int = 0,
+        method: Optional[str] = None,
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """Iterate classes associated with the files in this directory in order of their names
+
+        Files in groups of colliding names (see CollisionPolicy.GROUP) are also iterated.
+
+        Args:
+            prefetch (int, optional):
+                the number of upcoming files read ahead on a background thread pool. Defaults to 0.
+                If 0, nothing is read ahead.
+            method (Optional[str], optional):
+                the name of the method called for each file. Defaults to None.
+                If None, the files are just read into the page cache in advance.
+            args (Tuple[Any, ...], optional): positional arguments for the method. Defaults to ().
+            kwargs (Optional[Dict[str, Any]], optional): keyword arguments for the method. Defaults to None.
+
+        Yields:
+            File classes if method is None, otherwise tuples of a File class and the result of the method.
+
+        Example:
+            >>> for f in Data.Images.iter_files(prefetch=16):
+            ...     f.load()
+            >>> for f, img in Data.Images.iter_files(prefetch=16, method="load"):
+            ...     ...
+        """  # noqa
+        files: List[File] = []
+        for c in cls.children():
+            if isinstance(c, File):
+                files.append(c)
+            elif isinstance(c, Group):
+                files.extend(g for g in c.children() if isinstance(g, File))
+        # NOTE: groups are placed after the other children, so sort the files by their names again.  # noqa
+        files.sort(key=lambda f: os.path.basename(_Node.path(f)))
+        kwargs = kwargs or {}
+
+        def warm(f: File) -> File:
+            # NOTE: only local files benefit from the page cache.
+            if isinstance(_Node.backend(f), LocalBackend):
+                warm_up(_Node.path(f))
+            return f
+
+        def call(f: File) -> Tuple[File, Any]:
+            return f, getattr(f, method)(*args, **kwargs)  # type: ignore
+
+        if method is None:
+            return prefetch_map(warm, files, prefetch) if prefetch > 0 else iter(files)  # noqa
+        else:
+            return prefetch_map(call, files, prefetch)
+
+    def collisions(cls) -> List[Collision]:
+        """Return the report of names which collide in this subtree
+
+        Returns:
+            List[Collision]: the report of collisions.
+        """
+        collisions: List[Collision] = list(cls.__dict__.get("__dirapi_collisions__", ()))  # noqa
+        for c in cls.children():
+            if isinstance(c, Directory):
+                collisions.extend(c.collisions())
+        return collisions
+
+    def _clear_stats(cls) -> None:
+        super()._clear_stats()
+        setattr(cls, "__dirapi_rescan__", True)
+        for c in cls.children():
+            type(c)._clear_stats(c)
+
+    def _compute_stats(cls) -> Stats:
+        scan: Optional[_Scan] = cls.__dict__.get("__dirapi_scan__")
+        if scan is None or not cls.__dict__.get("__dirapi_rescan__"):
+            return merge_stats(_Node.stats(c) for c in cls.children())
+
+        # list this directory again and reuse the classes of the entries which still exist  # noqa
+        nodes: Dict[str, _Node] = {}
+        for c in cls.children():
+            for node in (c.children() if isinstance(c, Group) else (c, )):
+                nodes[_Node.path(node)] = node
+        stats: Stats = _scan_stats(_Node.backend(cls), _Node.path(cls), scan, nodes)  # noqa
+        setattr(cls, "__dirapi_rescan__", False)
+        return stats
+
+
+class Group(Directory):
+    """Metaclass for a group of files and directories whose names collide
+
+    A group does not correspond to a file or a directory.
+    Its path() is the path of the directory which contains the members of the group.  # noqa
+    """
+
+    def __new__(mcs, name, bases, namespace, root: str, *args, **kwargs):
+        _logger.debug(f"Group.__new__ called: name={name}, bases={bases}, namespace={namespace}")  # noqa
+        cls = type.__new__(mcs, name, bases, namespace)
+        _link(cls, root, kwargs.get("backend", _LOCAL_BACKEND))
+        return cls
+
+
+class File(_Node):
     """Metaclass for a file
     """
 
@@ -139,12 +748,24 @@ class File(type):
         _logger.debug(f"File.__init__ called: name={name}, bases={bases}, namespace={namespace}")  # noqa
         super().__init__(name, bases, namespace)
 
+    def _compute_stats(cls) -> Stats:
+        path: str = _Node.path(cls)
+        try:
+            st = _Node.backend(cls).stat(path)
+        except FileNotFoundError:
+            # the file has been deleted
+            return merge_stats(())
+        return file_stats(os.path.splitext(path)[1], st.st_size, st.st_mtime)  # noqa
+
 
 def _create_func_map(
     dir: str,
     name: str,
     func_map: Optional[Dict[str, Callable[[str, VarArg(), KwArg()], Any]]] = None,  # noqa
     ext_2_func_map: Optional[Dict[str, Dict[str, Callable[[str, VarArg(), KwArg()], Any]]]] = None,  # noqa
+    cache: Optional[ContentCache] = None,
+    backend: Backend = _LOCAL_BACKEND,
+    single_flight: Optional[SingleFlight] = None,
 ) -> Dict[str, Callable[[str, VarArg(), KwArg()], Any]]:
     f"""Create new func_map from func_map or ext_2_func_map to handle them in the same format.
 
@@ -156,6 +777,13 @@ def _create_func_map(
             The path corresponding a File metaclass will be given to the first argument of the methods.
         ext_2_func_map (Optional[Dict[str, Dict[str, Callable[[str, VarArg, optional):
             (File extension, Dictionary of attribute names and methods)-dictionary. Defaults to None.
+        cache (Optional[ContentCache], optional):
+            Cache to reuse results for byte-identical files. Defaults to None.
+            Only the methods in cache.methods are cached.
+        backend (Backend, optional):
+            Backend which resolves the path given to the methods. Defaults to LocalBackend.
+        single_flight (Optional[SingleFlight], optional):
+            Coalescer of concurrent calls for the same file and arguments. Defaults to None.
 
     Returns:
         Dict[str, Callable[[str, VarArg(), KwArg()], Any]]: (attribute name, method)-dictionary.
@@ -168,7 +796,7 @@ def _create_func_map(
     """  # noqa
 
     # preparation
-    path = os.path.join(dir, name)
+    path = backend.resolve(backend.join(dir, name))
     splitted_name, splitted_ext = os.path.splitext(name)
 
     # extract func_map
@@ -181,7 +809,14 @@ def _create_func_map(
 
     # wrap func with path
     for k, v in func_map.items():
-        func_map[k] = wraps(v)(partial(v, path))
+        func: Callable[..., Any] = v
+        # NOTE: methods which modify files are never cached
+        if cache is not None and k in cache.methods and (single_flight is None or k not in single_flight.write_methods):  # noqa
+            func = partial(cache.call, v)
+        if single_flight is not None:
+            func = partial(single_flight.call, k, func)
+        # NOTE: partial flattens nested partial objects, so the call overhead does not grow.  # noqa
+        func_map[k] = wraps(v)(partial(func, path))
         del func_map[k].__dict__["__qualname__"]  # TODO: Is there better way?
 
     return func_map
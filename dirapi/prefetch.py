@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections import deque
+import itertools
+import os
+from typing import TYPE_CHECKING, Callable, Deque, Iterable, Iterator, TypeVar
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+_READ_CHUNK_SIZE: int = 1 << 20
+
+
+def warm_up(path: str) -> None:
+    """Let the OS read a file into the page cache in advance
+
+    os.posix_fadvise with POSIX_FADV_WILLNEED is used where available,
+    which starts reading in the background and returns immediately.
+    Otherwise, the file is read and the contents are discarded.
+
+    Args:
+        path (str): the path to a file.
+    """
+    if hasattr(os, "posix_fadvise"):
+        fd: int = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    else:
+        with open(path, "rb") as f:
+            while f.read(_READ_CHUNK_SIZE):
+                pass
+
+
+def prefetch_map(
+    func: Callable[[T], S],
+    items: Iterable[T],
+    prefetch: int = 0,
+) -> Iterator[S]:
+    """Map func over items in order while computing upcoming ones on a thread pool
+
+    At most prefetch items are processed ahead of the consumer, so the memory usage is bounded.
+
+    Args:
+        func (Callable[[T], S]): function applied to each item.
+        items (Iterable[T]): items.
+        prefetch (int, optional):
+            the number of items processed ahead. Defaults to 0.
+            If prefetch <= 0, func is called sequentially in the consumer's thread.
+
+    Yields:
+        S: func(item) in the order of items.
+    """  # noqa
+    if prefetch <= 0:
+        for item in items:
+            yield func(item)
+        return
+
+    # NOTE: concurrent.futures is imported here because it is heavy and needed only when prefetching.  # noqa
+    from concurrent.futures import ThreadPoolExecutor
+
+    it: Iterator[T] = iter(items)
+    futures: Deque[Future[S]] = deque()
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        try:
+            for item in itertools.islice(it, prefetch):
+                futures.append(executor.submit(func, item))
+            while futures:
+                future = futures.popleft()
+                for item in itertools.islice(it, 1):
+                    futures.append(executor.submit(func, item))
+                yield future.result()
+        finally:
+            # NOTE: stop the pending tasks when the consumer stops the iteration  # noqa
+            for future in futures:
+                future.cancel()
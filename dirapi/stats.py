@@ -0,0 +1,64 @@
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, NamedTuple, Optional
+
+
+class Stats(NamedTuple):
+    """Aggregated statistics of a file or a directory
+
+    Attributes:
+        size (int): total size in bytes.
+        n_files (int): number of files.
+        ext_counts (Mapping[str, int]):
+            read-only (file extension, number of files)-dictionary.
+            Files without extension are counted with the key "".
+        mtime (Optional[float]):
+            the newest modification time of the files.
+            None if there are no files.
+    """
+    size: int
+    n_files: int
+    ext_counts: Mapping[str, int]
+    mtime: Optional[float]
+
+
+def file_stats(ext: str, size: int, mtime: float) -> Stats:
+    """Create Stats for a single file
+
+    Args:
+        ext (str): file extension like ".json".
+        size (int): file size in bytes.
+        mtime (float): modification time of the file.
+
+    Returns:
+        Stats: statistics of the file.
+    """
+    return Stats(size, 1, MappingProxyType({ext: 1}), mtime)
+
+
+def merge_stats(stats: Iterable[Stats]) -> Stats:
+    """Merge statistics of some files and directories
+
+    Args:
+        stats (Iterable[Stats]): statistics to be merged.
+
+    Returns:
+        Stats: merged statistics.
+
+    Example:
+        >>> merge_stats([file_stats(".txt", 3, 1.0), file_stats(".txt", 4, 2.0)])
+        Stats(size=7, n_files=2, ext_counts=mappingproxy({'.txt': 2}), mtime=2.0)
+    """  # noqa
+    size: int = 0
+    n_files: int = 0
+    ext_counts: Dict[str, int] = {}
+    mtime: Optional[float] = None
+
+    for s in stats:
+        size += s.size
+        n_files += s.n_files
+        for ext, cnt in s.ext_counts.items():
+            ext_counts[ext] = ext_counts.get(ext, 0) + cnt
+        if s.mtime is not None and (mtime is None or s.mtime > mtime):
+            mtime = s.mtime
+
+    return Stats(size, n_files, MappingProxyType(ext_counts), mtime)
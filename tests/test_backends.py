@@ -0,0 +1,242 @@
+import io
+import json
+import os
+import tarfile
+import zipfile
+from typing import Dict
+
+import pytest
+
+from dirapi.backends import (
+    Backend,
+    BackendPath,
+    DictBackend,
+    FsspecBackend,
+    LocalBackend,
+    TarBackend,
+    ZipBackend,
+)
+from dirapi.cache import ContentCache
+from dirapi.meta import Directory, File
+
+
+FILES: Dict[str, bytes] = {
+    "data/a.json": b"[1, 2]",
+    "data/b.json": b"[1, 2]",
+    "data/sub/c.txt": b"ccc",
+    "data/sub/deep/d.txt": b"dddd",
+}
+
+
+def _zip(tmp_path) -> ZipBackend:
+    path = str(tmp_path / "data.zip")
+    with zipfile.ZipFile(path, "w") as zf:
+        # NOTE: directory entries are omitted for "data/sub/deep/"
+        zf.writestr("data/", b"")
+        for name, data in FILES.items():
+            zf.writestr(name, data)
+    return ZipBackend(path)
+
+
+def _tar(tmp_path) -> TarBackend:
+    path = str(tmp_path / "data.tar.gz")
+    with tarfile.open(path, "w:gz") as tf:
+        for name, data in FILES.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = 1000000000
+            tf.addfile(info, io.BytesIO(data))
+    return TarBackend(path)
+
+
+def _dict(tmp_path) -> DictBackend:
+    return DictBackend({
+        "data": {
+            "a.json": b"[1, 2]",
+            "b.json": "[1, 2]",
+            "sub": {"c.txt": b"ccc", "deep": {"d.txt": "dddd"}},
+        }
+    })
+
+
+class _FakeFileSystem:
+    """Minimal filesystem which has the same interface as fsspec.AbstractFileSystem"""  # noqa
+
+    def __init__(self, files: Dict[str, bytes]):
+        self.files: Dict[str, bytes] = files
+
+    def ls(self, path: str, detail: bool = True):
+        prefix: str = f"{path}/" if path else ""
+        infos = {}
+        for name, data in self.files.items():
+            if not name.startswith(prefix):
+                continue
+            child, _, rest = name[len(prefix):].partition("/")
+            infos[prefix + child] = self.info(prefix + child) if not rest else {"name": prefix + child, "type": "directory", "size": 0}  # noqa
+        if not infos:
+            raise FileNotFoundError(path)
+        return list(infos.values())
+
+    def info(self, path: str):
+        return {"name": path, "type": "file", "size": len(self.files[path]), "mtime": 1000000000.0}  # noqa
+
+    def open(self, path: str, mode: str = "rb", **kwargs):
+        f = io.BytesIO(self.files[path])
+        return f if "b" in mode else io.TextIOWrapper(f, **kwargs)
+
+
+def _fsspec(tmp_path) -> FsspecBackend:
+    return FsspecBackend(_FakeFileSystem(FILES))
+
+
+@pytest.fixture(params=[_zip, _tar, _dict, _fsspec])
+def backend(request, tmp_path) -> Backend:
+    backend: Backend = request.param(tmp_path)
+    return backend
+
+
+def test_backend_scandir(backend: Backend):
+    assert sorted((e.name, e.is_dir()) for e in backend.scandir("")) == [("data", True)]  # noqa
+    assert sorted((e.name, e.is_dir()) for e in backend.scandir("data")) == [("a.json", False), ("b.json", False), ("sub", True)]  # noqa
+    assert sorted((e.name, e.is_dir()) for e in backend.scandir("data/sub/deep")) == [("d.txt", False)]  # noqa
+    with pytest.raises(FileNotFoundError):
+        list(backend.scandir("unknown"))
+
+
+def test_backend_open_and_stat(backend: Backend):
+    for name, data in FILES.items():
+        with backend.open(name) as f:
+            assert f.read() == data
+        with backend.open(name, "r") as f:
+            assert f.read() == data.decode()
+        assert backend.stat(name).st_size == len(data)
+
+
+def test_create_api_with_backend(backend: Backend):
+
+    # execute
+    Api: Directory = Directory(
+        "Api",
+        (),
+        {},
+        "",
+        {"load": lambda p: json.loads(p.read_bytes()), "get_path": lambda p: p},  # noqa
+        backend=backend,
+    )
+
+    # assert
+    assert isinstance(Api.Data.Sub.Deep.D, File)  # type: ignore
+    assert Api.Data.A.load() == [1, 2]  # type: ignore
+    assert Api.Data.Sub.C.get_path() == BackendPath(backend, "data/sub/c.txt")  # type: ignore # noqa
+    assert Api.Data.Sub.C.get_path().read_text() == "ccc"  # type: ignore
+    assert Api.Data.Sub.C.path() == "data/sub/c.txt"  # type: ignore
+    assert Api.Data.Sub.C.backend() is backend  # type: ignore
+    assert Api.stats().size == sum(len(v) for v in FILES.values())
+    assert Api.stats().n_files == len(FILES)
+    Api.Data.Sub.C.invalidate_stats()  # type: ignore
+    assert Api.stats().size == sum(len(v) for v in FILES.values())
+    assert [f.path() for f, _ in Api.Data.iter_files(prefetch=2, method="load")] == ["data/a.json", "data/b.json"]  # type: ignore # noqa
+
+
+def test_create_api_with_backend_and_cache(backend: Backend):
+
+    # preparation
+    cache = ContentCache(methods={"load"})
+
+    # execute
+    Api: Directory = Directory(
+        "Api",
+        (),
+        {},
+        "data",
+        {"load": lambda p: json.loads(p.read_bytes())},
+        cache=cache,
+        backend=backend,
+    )
+
+    # assert
+    assert Api.A.load() is Api.B.load()  # type: ignore
+    assert cache.info().hits == 1
+
+
+def test_local_backend(tmp_path):
+
+    # preparation
+    root = str(tmp_path)
+    os.makedirs(os.path.join(root, "d"))
+    with open(os.path.join(root, "f.txt"), "w") as f:
+        f.write("abc")
+    backend = LocalBackend()
+
+    # assert
+    assert sorted((e.name, e.is_dir()) for e in backend.scandir(root)) == [("d", True), ("f.txt", False)]  # noqa
+    assert backend.join(root, "f.txt") == os.path.join(root, "f.txt")
+    assert backend.resolve(os.path.join(root, "f.txt")) == os.path.join(root, "f.txt")  # noqa
+    assert backend.stat(os.path.join(root, "f.txt")).st_size == 3
+    with backend.open(os.path.join(root, "f.txt"), "r") as f:
+        assert f.read() == "abc"
+
+
+def test_fsspec_backend_memory_filesystem():
+
+    fsspec = pytest.importorskip("fsspec")
+
+    # preparation
+    fs = fsspec.filesystem("memory")
+    for name, data in FILES.items():
+        fs.pipe(f"/dirapi_test/{name}", data)
+    backend = FsspecBackend(fs)
+
+    # execute
+    Api: Directory = Directory("Api", (), {}, "/dirapi_test/data", {"load": lambda p: json.loads(p.read_bytes())}, backend=backend)  # noqa
+
+    # assert
+    assert Api.A.load() == [1, 2]  # type: ignore
+    assert Api.Sub.Deep.D.get_path().read_text() == "dddd"  # type: ignore
+    assert Api.stats().n_files == len(FILES)
+    fs.rm("/dirapi_test", recursive=True)
+
+
+@pytest.mark.parametrize("archive", ["zip", "tar"])
+def test_archive_with_dot_prefix(tmp_path, archive: str):
+
+    # preparation
+    # NOTE: like `tar cf data.tar -C root .`
+    root = tmp_path / "root"
+    for name, data in FILES.items():
+        os.makedirs(os.path.dirname(str(root / name)), exist_ok=True)
+        (root / name).write_bytes(data)
+    path = str(tmp_path / f"data.{archive}")
+    backend: Backend
+    if archive == "zip":
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("./", b"")
+            for name, data in FILES.items():
+                zf.writestr(f"./{name}", data)
+        backend = ZipBackend(path)
+    else:
+        with tarfile.open(path, "w") as tf:
+            tf.add(str(root), arcname=".")
+        backend = TarBackend(path)
+
+    # execute
+    Api: Directory = Directory("Api", (), {}, "", {"load": lambda p: json.loads(p.read_bytes())}, backend=backend)  # noqa
+
+    # assert
+    assert sorted(e.name for e in backend.scandir("")) == ["data"]
+    assert sorted(e.name for e in backend.scandir("./data/")) == ["a.json", "b.json", "sub"]  # noqa
+    assert Api.Data.A.load() == [1, 2]  # type: ignore
+    assert Api.stats().n_files == len(FILES)
+
+
+def test_backend_read_text_utf8():
+
+    # preparation
+    backend = DictBackend({"a.txt": "caf\u00e9"})
+
+    # execute
+    with backend.open("a.txt", "r") as f:
+        actual = f.read()
+
+    # assert
+    assert actual == "caf\u00e9"
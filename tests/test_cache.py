@@ -0,0 +1,126 @@
+import os
+
+from dirapi.cache import CacheInfo, ContentCache
+
+
+def _write(path: str, content: str):
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def test_content_cache_dedup(tmp_path):
+
+    # preparation
+    a = os.path.join(str(tmp_path), "a.txt")
+    b = os.path.join(str(tmp_path), "b.txt")
+    c = os.path.join(str(tmp_path), "c.txt")
+    _write(a, "same")
+    _write(b, "same")
+    _write(c, "different")
+    calls = []
+
+    def read(path):
+        calls.append(path)
+        return [open(path).read()]
+
+    cache = ContentCache(methods={"read"})
+
+    # execute
+    ra = cache.call(read, a)
+    rb = cache.call(read, b)
+    rc = cache.call(read, c)
+
+    # assert
+    assert ra is rb
+    assert ra == ["same"]
+    assert rc == ["different"]
+    assert calls == [a, c]
+    assert cache.info() == CacheInfo(hits=1, misses=2, bytes_saved=4, n_entries=2)  # noqa
+
+
+def test_content_cache_arguments(tmp_path):
+
+    # preparation
+    a = os.path.join(str(tmp_path), "a.txt")
+    _write(a, "abc")
+    cache = ContentCache(methods={"read"})
+
+    def read(path, n=None):
+        return open(path).read()[:n[0] if isinstance(n, list) else n]
+
+    # execute & assert
+    assert cache.call(read, a, 1) == "a"
+    assert cache.call(read, a, n=2) == "ab"
+    assert cache.call(read, a) == "abc"
+    assert cache.call(read, a, n=[1]) == "a"  # unhashable
+    assert cache.info().misses == 3
+
+
+def test_content_cache_modified_file(tmp_path):
+
+    # preparation
+    a = os.path.join(str(tmp_path), "a.txt")
+    _write(a, "abc")
+    cache = ContentCache(methods={"read"})
+
+    def read(path):
+        return open(path).read()
+
+    # execute
+    assert cache.call(read, a) == "abc"
+    _write(a, "abcdef")
+
+    # assert
+    assert cache.call(read, a) == "abcdef"
+    assert cache.info().hits == 0
+
+    cache.clear()
+    assert cache.info() == CacheInfo(0, 0, 0, 0)
+
+
+def test_content_cache_drops_replaced_contents(tmp_path):
+
+    # preparation
+    a = os.path.join(str(tmp_path), "a.txt")
+    b = os.path.join(str(tmp_path), "b.txt")
+    _write(a, "abc")
+    _write(b, "abc")
+    cache = ContentCache(methods={"read"})
+
+    def read(path):
+        return open(path).read()
+
+    # execute & assert
+    assert cache.call(read, a) == "abc"
+    assert cache.call(read, b) == "abc"
+    _write(a, "abcdef")
+    assert cache.call(read, a) == "abcdef"
+    # b still has the old contents
+    assert cache.info().n_entries == 2
+    _write(b, "xyz")
+    assert cache.call(read, b) == "xyz"
+    # nobody has the old contents anymore
+    assert cache.info().n_entries == 2
+    assert cache.call(read, a) == "abcdef"
+    assert cache.info().hits == 2
+
+
+def test_content_cache_maxsize(tmp_path):
+
+    # preparation
+    paths = [os.path.join(str(tmp_path), f"{i}.txt") for i in range(3)]
+    for i, path in enumerate(paths):
+        _write(path, str(i))
+    cache = ContentCache(methods={"read"}, maxsize=2)
+
+    def read(path):
+        return open(path).read()
+
+    # execute
+    for path in paths:
+        cache.call(read, path)
+    cache.call(read, paths[2])
+    cache.call(read, paths[0])
+
+    # assert
+    assert cache.info() == CacheInfo(hits=1, misses=4, bytes_saved=1, n_entries=2)  # noqa
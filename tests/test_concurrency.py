@@ -0,0 +1,267 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dirapi.cache import ContentCache
+from dirapi.concurrency import RWLock, SingleFlight, SingleFlightInfo
+from dirapi.meta import Directory
+
+from .test_meta import create_directories
+
+
+def test_single_flight_coalesces_concurrent_calls():
+
+    # preparation
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def load(path):
+        calls.append(path)
+        started.set()
+        release.wait()
+        return [path]
+
+    # execute
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(single_flight.call, "load", load, "a.txt")]
+        started.wait()
+        futures += [executor.submit(single_flight.call, "load", load, "a.txt") for _ in range(7)]  # noqa
+        while single_flight.info().coalesced < 7:
+            time.sleep(0.001)
+        release.set()
+        results = [f.result() for f in futures]
+
+    # assert
+    assert calls == ["a.txt"]
+    assert all(r is results[0] for r in results)
+    assert single_flight.info() == SingleFlightInfo(calls=1, coalesced=7)
+
+    # the result is not kept after the call finishes
+    single_flight.call("load", load, "a.txt")
+    assert calls == ["a.txt", "a.txt"]
+
+
+def test_single_flight_different_arguments():
+
+    single_flight = SingleFlight()
+
+    def load(path, n=0):
+        return (path, n)
+
+    assert single_flight.call("load", load, "a.txt") == ("a.txt", 0)
+    assert single_flight.call("load", load, "a.txt", 1) == ("a.txt", 1)
+    assert single_flight.call("load", load, "a.txt", n=2) == ("a.txt", 2)
+    assert single_flight.call("load", load, "a.txt", n=[3]) == ("a.txt", [3])  # unhashable # noqa
+    assert single_flight.info() == SingleFlightInfo(calls=4, coalesced=0)
+
+
+def test_single_flight_propagates_exceptions():
+
+    # preparation
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def load(path):
+        started.set()
+        release.wait()
+        raise ValueError(path)
+
+    # execute
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        f1 = executor.submit(single_flight.call, "load", load, "a.txt")
+        started.wait()
+        f2 = executor.submit(single_flight.call, "load", load, "a.txt")
+        while single_flight.info().coalesced < 1:
+            time.sleep(0.001)
+        release.set()
+
+        # assert
+        with pytest.raises(ValueError):
+            f1.result()
+        with pytest.raises(ValueError):
+            f2.result()
+
+
+def test_single_flight_write_methods_are_exclusive():
+
+    # preparation
+    single_flight = SingleFlight(lock_files=True, write_methods={"save"})
+    lock = threading.Lock()
+    active = {"read": 0, "write": 0}
+    violations = []
+
+    def enter(kind):
+        with lock:
+            active[kind] += 1
+            if active["write"] > 1 or (active["write"] and active["read"]):
+                violations.append(dict(active))
+
+    def leave(kind):
+        with lock:
+            active[kind] -= 1
+
+    def load(path, i):
+        enter("read")
+        time.sleep(0.001)
+        leave("read")
+
+    def save(path, i):
+        enter("write")
+        time.sleep(0.001)
+        leave("write")
+
+    # execute
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(single_flight.call, "save" if i % 3 == 0 else "load", save if i % 3 == 0 else load, "a.txt", i)  # noqa
+            for i in range(60)
+        ]
+        for f in futures:
+            f.result()
+
+    # assert
+    assert violations == []
+    assert single_flight.info().calls == 60
+
+
+def test_rwlock_allows_concurrent_readers():
+
+    # preparation
+    lock = RWLock()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def read():
+        with lock.read():
+            barrier.wait()
+
+    # execute & assert (barrier raises BrokenBarrierError if readers are serialized)  # noqa
+    threads = [threading.Thread(target=read) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not barrier.broken
+
+
+def test_rwlock_is_reentrant_while_writer_waits():
+
+    # preparation
+    lock = RWLock()
+    entered = threading.Event()
+    writer_started = threading.Event()
+    order = []
+
+    def read_twice():
+        with lock.read():
+            entered.set()
+            writer_started.wait(5)
+            # NOTE: wait until the writer is waiting for the lock
+            while not lock._waiting_writers:
+                time.sleep(0.001)
+            # a nested read must not wait for the waiting writer
+            with lock.read():
+                order.append("nested read")
+
+    def write():
+        entered.wait(5)
+        writer_started.set()
+        with lock.write():
+            order.append("write")
+
+    # execute
+    threads = [threading.Thread(target=read_twice), threading.Thread(target=write)]  # noqa
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+    # assert
+    assert not any(t.is_alive() for t in threads)
+    assert order == ["nested read", "write"]
+
+
+def test_rwlock_writer_reentrance():
+
+    # preparation
+    lock = RWLock()
+
+    # execute & assert
+    with lock.write():
+        with lock.read():
+            pass
+        with lock.write():
+            pass
+    with lock.read():
+        with pytest.raises(RuntimeError):
+            with lock.write():
+                pass
+    # the lock is released
+    with lock.write():
+        pass
+
+
+def test_directory_with_single_flight_and_cache(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path)
+    create_directories({"a.txt": "same", "b.txt": "same"}, root)
+    saved = []
+
+    def load(path):
+        return [open(path).read()]
+
+    def save(path, data):
+        # NOTE: a write method can call a read method of the same file
+        saved.append((path, Api.A.load()))  # type: ignore
+        with open(path, "w") as f:
+            f.write(data)
+        return len(data)
+
+    single_flight = SingleFlight(lock_files=True, write_methods={"save"})
+    cache = ContentCache(methods={"load", "save"})
+    Api: Directory = Directory("Api", (), {}, root, {"load": load, "save": save}, cache=cache, single_flight=single_flight)  # noqa
+
+    # execute
+    Api.A.save("same")  # type: ignore
+    Api.B.save("same")  # type: ignore
+
+    # assert
+    assert [p for p, _ in saved] == [Api.A.path(), Api.B.path()]  # type: ignore # noqa
+    assert Api.A.load() is Api.B.load()  # type: ignore
+
+
+def test_directory_with_single_flight(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path)
+    create_directories({"a.txt": "a"}, root)
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def read(path):
+        started.set()
+        release.wait()
+        return open(path).read()
+
+    Api: Directory = Directory("Api", (), {}, root, {"read": read}, single_flight=single_flight)  # noqa
+
+    # execute
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(Api.A.read)]  # type: ignore
+        started.wait()
+        futures += [executor.submit(Api.A.read) for _ in range(3)]  # type: ignore # noqa
+        while single_flight.info().coalesced < 3:
+            time.sleep(0.001)
+        release.set()
+        results = [f.result() for f in futures]
+
+    # assert
+    assert results == ["a"] * 4
+    assert single_flight.info() == SingleFlightInfo(calls=1, coalesced=3)
+    assert Api.A.read.__name__ == "read"  # type: ignore
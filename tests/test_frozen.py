@@ -0,0 +1,97 @@
+import os
+import sys
+import timeit
+
+import pytest
+
+from dirapi.frozen import FrozenApi, FrozenNode, dispatch_table
+from dirapi.help import help_tree
+from dirapi.meta import Directory
+
+from .test_meta import create_directories
+
+
+@pytest.fixture
+def api(tmp_path) -> Directory:
+    root: str = str(tmp_path)
+    create_directories({"a": {"b": {"c.txt": "c"}}, "d.txt": "d"}, root)
+    return Directory("Api", (), {}, root, {"read": lambda path: open(path).read(), "get_path": lambda path: path})  # noqa
+
+
+def test_freeze(api: Directory):
+
+    # execute
+    Frozen = api.freeze()
+
+    # assert
+    assert isinstance(Frozen, FrozenApi)
+    assert isinstance(Frozen.A.B, FrozenNode)  # type: ignore
+    assert Frozen.A.B.C.read() == "c"  # type: ignore
+    assert Frozen.D.get_path() == api.D.get_path()  # type: ignore
+    assert Frozen["Api.A.B.C.read"]() == "c"
+    assert "Api.D.read" in Frozen
+    assert sorted(Frozen) == ["Api.A.B.C.get_path", "Api.A.B.C.read", "Api.D.get_path", "Api.D.read"]  # noqa
+    assert len(Frozen) == 4
+    assert dispatch_table(Frozen)["Api.D.read"]() == "d"
+    assert help_tree(Frozen) == help_tree(api)
+
+
+def test_freeze_double_underscore_names(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path)
+    create_directories({"__init__.py": "", "__data": {"x.txt": "x"}}, root)
+    Api = Directory("Api", (), {}, root, {"read": lambda path: open(path).read()})  # noqa
+
+    # execute
+    Frozen = Api.freeze()
+
+    # assert
+    assert sorted(Frozen) == ["Api.__Data.X.read", "Api.__Init__.read"]
+    assert getattr(Frozen, "__Data").X.read() == "x"
+    assert getattr(Frozen, "__Init__").read() == ""
+    assert help_tree(Frozen) == help_tree(Api)
+
+
+def test_freeze_is_read_only(api: Directory):
+
+    # preparation
+    Frozen = api.freeze()
+
+    # execute & assert
+    with pytest.raises(AttributeError):
+        Frozen.A = None  # type: ignore
+    with pytest.raises(AttributeError):
+        Frozen.A.B.C.read = None  # type: ignore
+    with pytest.raises(AttributeError):
+        del Frozen.A  # type: ignore
+    with pytest.raises(TypeError):
+        dispatch_table(Frozen)["Api.D.read"] = None  # type: ignore
+
+
+@pytest.mark.skipif(not os.environ.get("DIRAPI_BENCHMARK"), reason="set DIRAPI_BENCHMARK=1 to run benchmarks")  # noqa
+def test_freeze_benchmark(api: Directory):
+    """Compare per-call overhead of the classes and the snapshot
+
+    Run with `DIRAPI_BENCHMARK=1 pytest -o addopts="" tests/test_frozen.py`.
+    """
+    if sys.gettrace() is not None:
+        pytest.skip("timings are distorted by tracing like coverage")
+
+    # preparation
+    # NOTE: measure the dispatch overhead, not I/O
+    Api = Directory("Api", (), {}, api.path(), {"nop": lambda path: None})
+    Frozen = Api.freeze()
+    table = dispatch_table(Frozen)
+    number = 100000
+
+    # execute
+    t_class = min(timeit.repeat(lambda: Api.A.B.C.nop(), number=number, repeat=5))  # type: ignore # noqa
+    t_frozen = min(timeit.repeat(lambda: Frozen.A.B.C.nop(), number=number, repeat=5))  # type: ignore # noqa
+    t_table = min(timeit.repeat(lambda: table["Api.A.B.C.nop"](), number=number, repeat=5))  # noqa
+
+    # assert
+    # NOTE: allow 10% for timing noise
+    report = f"class={t_class / number * 1e9:.1f}ns, frozen={t_frozen / number * 1e9:.1f}ns, table={t_table / number * 1e9:.1f}ns"  # noqa
+    assert t_frozen <= t_class * 1.1, report
+    assert t_table <= t_class * 1.1, report
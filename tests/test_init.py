@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+import dirapi
+
+
+# modules which must not be imported by `import dirapi`
+HEAVY_MODULES = (
+    "concurrent.futures",
+    "dirapi.help",
+    "dirapi.meta",
+    "hashlib",
+    "inspect",
+    "mypy_extensions",
+    "typing",
+)
+
+
+def _importtime(statement: str) -> Dict[str, int]:
+    """Return (module, cumulative import time in us)-dictionary with python -X importtime"""  # noqa
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_dirapi_is_lazy():
+
+    # execute
+    times = _importtime("import dirapi")
+
+    # assert
+    assert "dirapi" in times
+    for module in HEAVY_MODULES:
+        assert module not in times, module
+
+
+@pytest.mark.skipif(not os.environ.get("DIRAPI_BENCHMARK"), reason="set DIRAPI_BENCHMARK=1 to run benchmarks")  # noqa
+def test_import_dirapi_benchmark():
+    """Compare the time of `import dirapi` with `import typing`
+
+    Run with `DIRAPI_BENCHMARK=1 pytest -o addopts="" tests/test_init.py`.
+    """
+
+    # preparation
+    # NOTE: compile dirapi in advance not to measure the time to write .pyc files  # noqa
+    _importtime("import dirapi")
+
+    # execute
+    t_dirapi = min(_importtime("import dirapi")["dirapi"] for _ in range(5))
+    t_typing = min(_importtime("import typing")["typing"] for _ in range(5))
+
+    # assert
+    assert t_dirapi < t_typing, f"dirapi={t_dirapi}us, typing={t_typing}us"
+
+
+def test_import_create_api_is_light():
+
+    # execute
+    times = _importtime("from dirapi import create_api")
+
+    # assert
+    assert "dirapi.api_factory" in times
+    assert "dirapi.meta" in times
+    for module in ("concurrent.futures", "dirapi.help", "hashlib", "inspect", "mypy_extensions"):  # noqa
+        assert module not in times, module
+
+
+@pytest.mark.parametrize("name", dirapi.__all__)
+def test_lazy_attributes(name: str):
+    assert getattr(dirapi, name).__name__ == name
+    assert name in dir(dirapi)
+
+
+def test_type_checking_is_private():
+    assert "TYPE_CHECKING" not in dir(dirapi)
+    assert not hasattr(dirapi, "TYPE_CHECKING")
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        dirapi.unknown_attribute  # type: ignore
@@ -0,0 +1,135 @@
+import os
+import shutil
+
+import pytest
+
+from dirapi.manifest import Manifest
+from dirapi.meta import Directory, File, Group
+
+from .test_meta import DictStructure, create_directories
+
+
+STRUCTURE: DictStructure = {
+    "a.json": "[1]",
+    "a.csv": "1",
+    "sub": {
+        "b.txt": "bb",
+        "deep": {"c.txt": "ccc"},
+    },
+    "empty": {},
+}
+
+
+def _walk(d, prefix=""):
+    for attr, c in d.named_children():
+        yield f"{prefix}{attr}", type(c), c.path()
+        if isinstance(c, Directory):
+            yield from _walk(c, f"{prefix}{attr}.")
+
+
+@pytest.fixture
+def api(tmp_path) -> Directory:
+    root: str = str(tmp_path / "root")
+    create_directories(STRUCTURE, root)
+    return Directory("Api", (), {}, root, {"read": lambda path: open(path).read()}, collision="group")  # noqa
+
+
+def test_to_manifest(api: Directory):
+
+    # execute
+    manifest = api.to_manifest()
+
+    # assert
+    assert isinstance(manifest, Manifest)
+    assert len(manifest) == 8
+    rows = {p: i for i, p in enumerate(manifest.path)}
+    assert manifest.path[0] == ""
+    assert manifest.parent[0] == -1
+    assert manifest.name[0] == "Api"
+    assert manifest.size[0] == api.stats().size
+    assert manifest.name[rows["a.json"]] == "A.Json"
+    assert manifest.parent[rows["sub/deep/c.txt"]] == rows["sub/deep"]
+    assert manifest.depth[rows["sub/deep/c.txt"]] == 3
+    assert manifest.is_dir[rows["sub/deep"]]
+    assert not manifest.is_dir[rows["sub/b.txt"]]
+    assert manifest.size[rows["sub/b.txt"]] == 2
+    assert manifest.size[rows["sub"]] == 5
+    assert manifest.mtime[rows["empty"]] == 0.0
+    assert manifest.mtime[rows["sub/b.txt"]] == os.stat(os.path.join(manifest.root, "sub", "b.txt")).st_mtime  # noqa
+
+
+def test_manifest_create_api(api: Directory):
+
+    # preparation
+    manifest = api.to_manifest()
+    root: str = manifest.root
+    moved: str = root + "_moved"
+    shutil.move(root, moved)
+
+    # execute
+    # NOTE: no directories are scanned
+    Api = manifest.create_api({"read": lambda path: open(path).read()}, root_dir=moved)  # noqa
+
+    # assert
+    assert [(a, t) for a, t, _ in _walk(Api)] == [(a, t) for a, t, _ in _walk(api)]  # noqa
+    assert isinstance(Api.A, Group)  # type: ignore
+    assert isinstance(Api.Sub.Deep.C, File)  # type: ignore
+    assert Api.Sub.Deep.C.read() == "ccc"  # type: ignore
+    assert Api.stats() == api.stats()
+    assert Api.to_manifest().name == manifest.name
+
+
+def test_manifest_create_api_collision(api: Directory):
+
+    # preparation
+    manifest = api.to_manifest()
+
+    # execute
+    Api = manifest.create_api(collision="suffix")
+
+    # assert
+    assert manifest.collision == "group"
+    assert Api.to_manifest().collision == "suffix"
+    assert isinstance(Api.A, File)  # type: ignore
+    assert isinstance(Api.A_2, File)  # type: ignore
+
+
+def test_manifest_npz(api: Directory, tmp_path):
+
+    np = pytest.importorskip("numpy")
+
+    # preparation
+    manifest = api.to_manifest()
+    file = str(tmp_path / "manifest.npz")
+
+    # execute
+    arrays = manifest.to_numpy()
+    manifest.save_npz(file)
+    loaded = Manifest.load_npz(file)
+
+    # assert
+    assert set(arrays["path"][(~arrays["is_dir"]) & (arrays["size"] > 2)]) == {"a.json", "sub/deep/c.txt"}  # noqa
+    assert np.all(arrays["depth"] == np.array(manifest.depth))
+    assert loaded.root == manifest.root
+    assert loaded.collision == "group"
+    assert loaded.columns() == manifest.columns()
+    assert loaded.create_api().to_manifest().name == manifest.name
+
+
+def test_manifest_parquet(api: Directory, tmp_path):
+
+    pytest.importorskip("pyarrow")
+
+    # preparation
+    manifest = api.to_manifest()
+    file = str(tmp_path / "manifest.parquet")
+
+    # execute
+    manifest.save_parquet(file)
+    loaded = Manifest.load_parquet(file)
+
+    # assert
+    assert loaded.root == manifest.root
+    assert loaded.columns() == manifest.columns()
+    assert loaded.collision == "group"
+    assert loaded.create_api().to_manifest().name == manifest.name
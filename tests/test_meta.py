@@ -4,9 +4,13 @@ import pytest
 import shutil
 from typing import Any, Callable, Dict, Iterator, Union
 
+from dirapi.cache import ContentCache
 from dirapi.meta import (
+    Collision,
+    CollisionPolicy,
     Directory,
     File,
+    Group,
 )
 from dirapi.utils import snake2camel
 
@@ -214,3 +218,440 @@ def test_directory_file_for_ext_2_func_map(sample_directory: str):
     actual = getattr(Api._SampleOuter._SampleInner2._SampleInner21._Test_4, "read")()  # type: ignore  # noqa
     expected = json.load(open(getattr(Api._SampleOuter._SampleInner2._SampleInner21._Test_4, "get_path")()))  # type: ignore  # noqa
     assert actual == expected
+
+
+def test_directory_stats(sample_directory: str):
+
+    # preparation
+    root: str = sample_directory
+
+    # execute
+    Api: Directory = Directory("Api", (), {}, root)
+
+    # assert
+    stats = Api.stats()
+    assert stats.size == sum(len(v) for v in ["test1 content", "test2 content", "[1,2,3]", "[1,2,3]"])  # noqa
+    assert stats.n_files == 4
+    assert stats.ext_counts == {".txt": 2, ".json": 2}
+    assert stats.mtime == max(
+        os.stat(os.path.join(dirpath, f)).st_mtime
+        for dirpath, _, files in os.walk(root)
+        for f in files
+    )
+    assert Api._SampleOuter._SampleInner1.stats().n_files == 2  # type: ignore # noqa
+    assert Api._SampleOuter._SampleInner1._Test1.stats().size == len("test1 content")  # type: ignore # noqa
+    assert Api._SampleOuter._SampleInner3.stats() == (0, 0, {}, None)  # type: ignore # noqa
+    # memoized
+    assert Api.stats() is stats
+
+
+def test_directory_invalidate_stats(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path)
+    create_directories({"a": {"x.txt": "x"}, "b": {"y.txt": "yy"}}, root)
+    Api: Directory = Directory("Api", (), {}, root)
+    stats_b = Api.B.stats()  # type: ignore
+
+    # execute
+    with open(os.path.join(root, "a", "x.txt"), "w") as f:
+        f.write("xxxx")
+    Api.A.X.invalidate_stats()  # type: ignore
+
+    # assert
+    assert Api.stats().size == 4 + 2
+    assert Api.A.stats().size == 4  # type: ignore
+    # the other subtree is not recomputed
+    assert Api.B.stats() is stats_b  # type: ignore
+
+
+def test_directory_invalidate_stats_added_and_deleted(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path)
+    create_directories({"sub": {"x.txt": "x", "y.txt": "yy"}, "z.txt": "zzz", ".hidden": {}}, root)  # noqa
+    Api: Directory = Directory("Api", (), {}, root, include=["*.txt"])
+    stats_z = Api.Z.stats()  # type: ignore
+
+    # execute
+    os.remove(os.path.join(root, "sub", "y.txt"))
+    create_directories({"sub": {"w.txt": "wwww", "v.json": "{}", "new": {"u.txt": "uuuuu"}}, ".hidden": {"t.txt": "t"}}, root)  # noqa
+    Api.Sub.invalidate_stats()  # type: ignore
+
+    # assert
+    assert Api.Sub.stats().size == 1 + 4 + 5  # type: ignore
+    assert Api.Sub.stats().n_files == 3  # type: ignore
+    assert Api.stats().size == 1 + 4 + 5 + 3
+    assert Api.Z.stats() is stats_z  # type: ignore
+    # the class for the deleted file remains with empty statistics
+    assert Api.Sub.Y.stats().n_files == 0  # type: ignore
+    Api.Sub.Y.invalidate_stats()  # type: ignore
+    assert Api.Sub.Y.stats().n_files == 0  # type: ignore
+    # the deleted directory
+    shutil.rmtree(os.path.join(root, "sub"))
+    Api.Sub.invalidate_stats()  # type: ignore
+    assert Api.stats().size == 3
+
+
+def test_directory_methods_shadowing_node_methods(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path)
+    create_directories({"a": {"x.txt": "x"}, "y.txt": "yy"}, root)
+    func_map: Dict[str, Callable[..., Any]] = {
+        "stats": lambda path: "stats",
+        "path": lambda path: "path",
+        "backend": lambda path: "backend",
+        "parent": lambda path: "parent",
+    }
+
+    # execute
+    Api: Directory = Directory("Api", (), {}, root, func_map)
+    Api.A.X.invalidate_stats()  # type: ignore
+    manifest = Api.to_manifest()
+    files = list(Api.iter_files(prefetch=1))
+    Frozen = Api.freeze()
+
+    # assert
+    assert Api.Y.stats() == "stats"  # type: ignore
+    assert Api.Y.path() == "path"  # type: ignore
+    assert Api.stats().size == 3
+    assert Api.A.stats().n_files == 1  # type: ignore
+    assert manifest.path == ["", "y.txt", "a", "a/x.txt"]
+    assert files == [Api.Y]  # type: ignore
+    assert Frozen.A.X.path() == "path"  # type: ignore
+
+
+def test_directory_with_cache(sample_directory: str):
+
+    # preparation
+    root: str = sample_directory
+    cache = ContentCache(methods={"read"})
+    func_map: Dict[str, Callable[[str], Any]] = {
+        "read": lambda path: json.load(open(path)),
+    }
+
+    # execute
+    Api: Directory = Directory("Api", (), {}, root, func_map, None, cache)
+    actual3 = Api._SampleOuter._SampleInner2._SampleInner21._Test_3.read()  # type: ignore # noqa
+    actual4 = Api._SampleOuter._SampleInner2._SampleInner21._Test_4.read()  # type: ignore # noqa
+
+    # assert
+    assert actual3 == [1, 2, 3]
+    assert actual3 is actual4
+    assert cache.info().hits == 1
+    assert cache.info().bytes_saved == len("[1,2,3]")
+
+
+def test_directory_with_cache_only_listed_methods(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path)
+    create_directories({"a.txt": "same", "b.txt": "same"}, root)
+    cache = ContentCache(methods={"read"})
+    saved = []
+
+    def save(path, data):
+        saved.append(path)
+        with open(path, "w") as f:
+            f.write(data)
+
+    func_map: Dict[str, Callable[..., Any]] = {
+        "read": lambda path: [open(path).read()],
+        "get_path": lambda path: path,
+        "save": save,
+    }
+
+    # execute
+    Api: Directory = Directory("Api", (), {}, root, func_map, None, cache)
+    actual_a = Api.A.read()  # type: ignore
+    actual_b = Api.B.read()  # type: ignore
+    Api.A.save("new")  # type: ignore
+    Api.B.save("new")  # type: ignore
+
+    # assert
+    assert actual_a is actual_b
+    assert Api.A.get_path() == os.path.join(root, "a.txt")  # type: ignore
+    assert Api.B.get_path() == os.path.join(root, "b.txt")  # type: ignore
+    assert saved == [os.path.join(root, "a.txt"), os.path.join(root, "b.txt")]
+    assert open(os.path.join(root, "b.txt")).read() == "new"
+    assert cache.info().hits == 1
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_directory_iter_files(tmp_path, prefetch: int):
+
+    # preparation
+    root: str = str(tmp_path)
+    names = [f"img{i:03}.txt" for i in range(10)]
+    create_directories({**{name: name for name in names}, "sub": {}}, root)
+    Api: Directory = Directory("Api", (), {}, root, {"read": lambda path: open(path).read()})  # noqa
+
+    # execute
+    files = list(Api.iter_files(prefetch=prefetch))
+    results = list(Api.iter_files(prefetch=prefetch, method="read"))
+
+    # assert
+    assert [os.path.basename(f.path()) for f in files] == names
+    assert all(isinstance(f, File) for f in files)
+    assert [f for f, _ in results] == files
+    assert [r for _, r in results] == names
+
+
+def _filter_structure(root: str):
+    create_directories(
+        {
+            ".git": {"config": "x"},
+            ".hidden.txt": "x",
+            "__pycache__": {"a.pyc": "x"},
+            "a.json": "{}",
+            "b.txt": "b",
+            "sub": {
+                "c.json": "{}",
+                "d.txt": "d",
+                "deep": {"e.json": "{}"},
+            },
+        },
+        root,
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        (
+            {},
+            {"a.json", "b.txt", "sub/c.json", "sub/d.txt", "sub/deep/e.json", "__pycache__/a.pyc"},  # noqa
+        ),
+        (
+            {"skip_hidden": False},
+            {".git/config", ".hidden.txt", "a.json", "b.txt", "sub/c.json", "sub/d.txt", "sub/deep/e.json", "__pycache__/a.pyc"},  # noqa
+        ),
+        (
+            {"include": ["*.json"], "exclude": ["__pycache__"]},
+            {"a.json", "sub/c.json", "sub/deep/e.json"},
+        ),
+        (
+            {"exclude": ["__pycache__", "sub/deep", "*.txt"]},
+            {"a.json", "sub/c.json"},
+        ),
+        (
+            # NOTE: "*" matches "/" as well as fnmatch
+            {"include": ["sub/*"], "exclude": ["__pycache__"]},
+            {"sub/c.json", "sub/d.txt", "sub/deep/e.json"},
+        ),
+        (
+            {"max_depth": 1},
+            {"a.json", "b.txt"},
+        ),
+        (
+            {"max_depth": 2, "exclude": ["__pycache__"]},
+            {"a.json", "b.txt", "sub/c.json", "sub/d.txt"},
+        ),
+    ]
+)
+def test_directory_filter(tmp_path, kwargs: Dict[str, Any], expected):
+
+    # preparation
+    root: str = str(tmp_path)
+    _filter_structure(root)
+
+    # execute
+    Api: Directory = Directory("Api", (), {}, root, **kwargs)
+
+    # assert
+    def walk(d):
+        for c in d.children():
+            if isinstance(c, File):
+                yield os.path.relpath(c.path(), root).replace(os.sep, "/")
+            else:
+                yield from walk(c)
+
+    assert set(walk(Api)) == expected
+    assert Api.stats().n_files == len(expected)
+
+
+def test_directory_filter_compiled_once(tmp_path, monkeypatch):
+
+    # preparation
+    import dirapi.meta
+    root: str = str(tmp_path)
+    _filter_structure(root)
+    calls = []
+    compile_patterns = dirapi.meta._compile_patterns
+
+    def spy(patterns):
+        calls.append(patterns)
+        return compile_patterns(patterns)
+
+    monkeypatch.setattr(dirapi.meta, "_compile_patterns", spy)
+
+    # execute
+    Api: Directory = Directory("Api", (), {}, root, include=["*.json"], exclude=["__pycache__"])  # noqa
+
+    # assert
+    assert calls == [["*.json"], ["__pycache__"]]
+    assert Api.Sub.Deep.E.path() == os.path.join(root, "sub", "deep", "e.json")  # type: ignore # noqa
+
+
+def test_directory_filter_max_depth_not_listed(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path)
+    _filter_structure(root)
+
+    # execute
+    Api: Directory = Directory("Api", (), {}, root, max_depth=1)
+
+    # assert
+    assert isinstance(Api.Sub, Directory)  # type: ignore
+    assert list(Api.Sub.children()) == []  # type: ignore
+
+
+def test_directory_follow_symlinks(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path / "root")
+    create_directories({"real": {"a.txt": "a"}}, root)
+    os.symlink(os.path.join(root, "real"), os.path.join(root, "link"))
+
+    # execute
+    Api1: Directory = Directory("Api", (), {}, root)
+    Api2: Directory = Directory("Api", (), {}, root, follow_symlinks=True)
+
+    # assert
+    assert not hasattr(Api1, "Link")
+    assert isinstance(Api2.Link.A, File)  # type: ignore
+
+
+def _collision_structure(root: str):
+    create_directories(
+        {
+            "a": {"x.txt": "x"},
+            "a.csv": "1,2",
+            "a.json": "[1]",
+            "b.txt": "b",
+        },
+        root,
+    )
+
+
+@pytest.mark.parametrize(
+    "policy,expected",
+    [
+        (
+            "suffix",
+            {"A": "a.csv", "A_2": "a.json", "A_3": "a", "B": "b.txt"},
+        ),
+        (
+            CollisionPolicy.SUFFIX,
+            {"A": "a.csv", "A_2": "a.json", "A_3": "a", "B": "b.txt"},
+        ),
+        (
+            "extension-qualified",
+            {"A_csv": "a.csv", "A_json": "a.json", "A": "a", "B": "b.txt"},
+        ),
+        (
+            "group",
+            {"A.Csv": "a.csv", "A.Json": "a.json", "A._1": "a", "B": "b.txt"},
+        ),
+    ]
+)
+def test_directory_collision(tmp_path, policy, expected: Dict[str, str]):
+
+    # preparation
+    root: str = str(tmp_path)
+    _collision_structure(root)
+
+    # execute
+    Api: Directory = Directory("Api", (), {}, root, {"get_path": lambda path: path}, collision=policy)  # noqa
+
+    # assert
+    for attr, name in expected.items():
+        obj = Api
+        for a in attr.split("."):
+            obj = getattr(obj, a)
+        assert obj.path() == os.path.join(root, name)
+        assert obj.__qualname__ == f"Api.{attr}"
+    assert Api.stats().n_files == 4
+    assert Api.collisions() == [
+        Collision(
+            root,
+            "A",
+            ("a.csv", "a.json", "a"),
+            tuple(k for k, v in sorted(expected.items(), key=lambda kv: ["a.csv", "a.json", "a", "b.txt"].index(kv[1])) if k != "B"),  # noqa
+        )
+    ]
+
+
+def test_directory_collision_group(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path)
+    _collision_structure(root)
+
+    # execute
+    Api: Directory = Directory("Api", (), {}, root, {"get_path": lambda path: path}, collision="group")  # noqa
+
+    # assert
+    assert isinstance(Api.A, Group)  # type: ignore
+    assert Api.A.Json.get_path() == os.path.join(root, "a.json")  # type: ignore # noqa
+    assert Api.A.stats().n_files == 3  # type: ignore
+    assert [f.path() for f in Api.A.iter_files()] == [os.path.join(root, "a.csv"), os.path.join(root, "a.json")]  # type: ignore # noqa
+    assert Api.A._1.X.parent().parent() is Api.A  # type: ignore
+    assert Api.A.path() == root  # type: ignore
+
+
+def test_directory_collision_group_iter_files(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path)
+    create_directories({"img1.png": "1", "img1.json": "{}", "img2.png": "2", "img1": {}}, root)  # noqa
+    Api: Directory = Directory("Api", (), {}, root, {"read": lambda path: open(path).read()}, collision="group")  # noqa
+
+    # execute
+    files = list(Api.iter_files())
+    results = list(Api.iter_files(prefetch=2, method="read"))
+
+    # assert
+    assert [os.path.basename(f.path()) for f in files] == ["img1.json", "img1.png", "img2.png"]  # noqa
+    assert files == [Api.Img1.Json, Api.Img1.Png, Api.Img2]  # type: ignore
+    assert [r for _, r in results] == ["{}", "1", "2"]
+
+
+def test_directory_collision_file_and_directory(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path)
+    create_directories({"a": {"x.txt": "x"}, "a.json": "[1]", "b": {}, "b.csv": "1", "b.tsv": "2"}, root)  # noqa
+
+    # execute
+    Suffix: Directory = Directory("Api", (), {}, root, collision="suffix")
+    Grouped: Directory = Directory("Api", (), {}, root, collision="group")
+
+    # assert
+    # NOTE: files come before directories
+    assert Suffix.A.path() == os.path.join(root, "a.json")  # type: ignore
+    assert Suffix.A_2.path() == os.path.join(root, "a")  # type: ignore
+    assert isinstance(Grouped.A._1, Directory)  # type: ignore
+    assert Grouped.A.Json.path() == os.path.join(root, "a.json")  # type: ignore # noqa
+    assert [c.__qualname__ for c in Grouped.B.children()] == ["Api.B.Csv", "Api.B.Tsv", "Api.B._1"]  # type: ignore # noqa
+    assert Grouped.B._1.path() == os.path.join(root, "b")  # type: ignore
+
+
+def test_directory_collision_error(tmp_path):
+
+    # preparation
+    root: str = str(tmp_path)
+    _collision_structure(root)
+
+    # execute & assert
+    with pytest.raises(ValueError):
+        Directory("Api", (), {}, root, collision="error")
+    with pytest.raises(ValueError):
+        Directory("Api", (), {}, root, collision="unknown")
+
+
+def test_directory_collision_no_collision(sample_directory: str):
+    Api: Directory = Directory("Api", (), {}, sample_directory, collision="error")  # noqa
+    assert Api.collisions() == []
@@ -0,0 +1,59 @@
+import threading
+import time
+
+import pytest
+
+from dirapi.prefetch import prefetch_map, warm_up
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 4, 100])
+def test_prefetch_map_order(prefetch: int):
+
+    def f(x: int) -> int:
+        time.sleep(0.001 * (x % 3))
+        return x * 2
+
+    assert list(prefetch_map(f, range(20), prefetch)) == [x * 2 for x in range(20)]  # noqa
+
+
+def test_prefetch_map_bounded():
+
+    # preparation
+    lock = threading.Lock()
+    started = []
+
+    def f(x: int) -> int:
+        with lock:
+            started.append(x)
+        return x
+
+    # execute
+    it = prefetch_map(f, range(100), 3)
+    first = next(it)
+    time.sleep(0.05)
+
+    # assert
+    assert first == 0
+    # the first item, the replenished item and the prefetched items
+    assert len(started) <= 1 + 3
+    it.close()  # type: ignore
+
+
+def test_prefetch_map_exception():
+
+    def f(x: int) -> int:
+        if x == 2:
+            raise ValueError(x)
+        return x
+
+    it = prefetch_map(f, range(5), 2)
+    assert next(it) == 0
+    assert next(it) == 1
+    with pytest.raises(ValueError):
+        next(it)
+
+
+def test_warm_up(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("abc")
+    warm_up(str(path))
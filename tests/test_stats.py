@@ -0,0 +1,32 @@
+import pytest
+
+from dirapi.stats import Stats, file_stats, merge_stats
+
+
+def test_file_stats():
+    assert file_stats(".txt", 3, 1.0) == Stats(3, 1, {".txt": 1}, 1.0)
+
+
+def test_merge_stats():
+    actual = merge_stats([
+        file_stats(".txt", 3, 1.0),
+        file_stats(".json", 4, 3.0),
+        merge_stats([
+            file_stats(".txt", 5, 2.0),
+            file_stats("", 6, 0.0),
+        ]),
+    ])
+    expected = Stats(18, 4, {".txt": 2, ".json": 1, "": 1}, 3.0)
+    assert actual == expected
+
+
+def test_merge_stats_empty():
+    assert merge_stats([]) == Stats(0, 0, {}, None)
+
+
+def test_stats_ext_counts_is_read_only():
+    stats = merge_stats([file_stats(".txt", 3, 1.0)])
+    with pytest.raises(TypeError):
+        stats.ext_counts[".txt"] = 0  # type: ignore
+    with pytest.raises(TypeError):
+        file_stats(".txt", 3, 1.0).ext_counts[".json"] = 1  # type: ignore